@@ -1,24 +1,52 @@
 """Command-line interface for RX Page Marker."""
 
+import functools
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Type
 
 import click
 
 from . import __version__
-from .marker import PageMarkerInserter
-from .pdf_extractor import (
+from .exceptions import (
     InvalidParameterError,
     MissingDependencyError,
     PDFExtractionError,
-    PDFExtractor,
     PDFNotFoundError,
-    print_validation_results,
-    validate_snippets,
 )
+from .marker import PageMarkerInserter
 from .template import generate_template
 
+# pdf_extractor is imported inside the commands that need it, and it imports
+# PyMuPDF and pdfplumber only when a PDF is opened; `mark`, `generate`,
+# `validate` and `--version` start without them
+
+
+def _handle_errors(
+    handlers: Dict[Type[BaseException], str]
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Report exceptions raised by a command as one line on stderr and exit 1.
+
+    Args:
+        handlers: Exception class -> message prefix, checked in order
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                for exc_type, prefix in handlers.items():
+                    if isinstance(e, exc_type):
+                        click.echo(f"{prefix} {e}", err=True)
+                        sys.exit(1)
+                raise
+
+        return wrapper
+
+    return decorator
+
 
 @click.group()
 @click.version_option(version=__version__)
@@ -32,17 +60,26 @@ def cli() -> None:
 @click.argument("page_references", type=click.Path(exists=True, path_type=Path))
 @click.argument("output_html", type=click.Path(path_type=Path), required=False)
 @click.option(
-    "--verbose", "-v", is_flag=True, help="Enable verbose output (currently unused)"
+    "--verbose", "-v", is_flag=True, help="Print per-page progress as markers are inserted"
 )
 @click.option(
     "--inject-css", is_flag=True, help="Inject CSS styling to make page markers visible"
 )
+@click.option(
+    "--parser",
+    type=click.Choice(["html.parser", "lxml"]),
+    default="html.parser",
+    show_default=True,
+    help="HTML parser (lxml is faster but wraps fragments in <html><body>)",
+)
+@_handle_errors({Exception: "Error:"})
 def mark(
     input_html: Path,
     page_references: Path,
     output_html: Optional[Path],
     verbose: bool,
     inject_css: bool,
+    parser: str,
 ) -> None:
     """Insert page markers into HTML file.
 
@@ -58,13 +95,12 @@ def mark(
     Examples:
         rx-pagemarker mark book.html pages.json output.html
         rx-pagemarker mark book.html pages.json --inject-css
+        rx-pagemarker mark book.html pages.json --parser lxml
     """
-    try:
-        inserter = PageMarkerInserter(input_html, page_references, output_html, inject_css)
-        inserter.run()
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    inserter = PageMarkerInserter(
+        input_html, page_references, output_html, inject_css, verbose=verbose, parser=parser
+    )
+    inserter.run()
 
 
 @cli.command()
@@ -83,6 +119,7 @@ def mark(
     is_flag=True,
     help="Use Roman numerals (i, ii, iii) for front matter",
 )
+@_handle_errors({Exception: "Error:"})
 def generate(num_pages: int, output_file: Path, start_page: int, roman: bool) -> None:
     """Generate a template JSON file for page references.
 
@@ -99,11 +136,7 @@ def generate(num_pages: int, output_file: Path, start_page: int, roman: bool) ->
         click.echo("Error: Number of pages must be positive", err=True)
         sys.exit(1)
 
-    try:
-        generate_template(num_pages, output_file, start_page, roman)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    generate_template(num_pages, output_file, start_page, roman)
 
 
 @cli.command()
@@ -217,6 +250,27 @@ def generate(num_pages: int, output_file: Path, start_page: int, roman: bool) ->
     default=False,
     help="Enable two-column layout extraction (skips footnote zone, extracts from body columns only)",
 )
+@click.option(
+    "--html-cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Cache the fuzzy matcher's parsed HTML text here to speed up repeated runs",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Processes to use for PyMuPDF page extraction and --fuzzy-match matching (default: 1)",
+)
+@_handle_errors(
+    {
+        MissingDependencyError: "✗ Missing dependency:",
+        PDFNotFoundError: "✗ File not found:",
+        InvalidParameterError: "✗ Invalid parameter:",
+        PDFExtractionError: "✗ Extraction failed:",
+        Exception: "✗ Unexpected error:",
+    }
+)
 def extract(
     pdf_file: Path,
     output_json: Path,
@@ -238,6 +292,8 @@ def extract(
     min_font_size: float,
     context_words: int,
     two_column: bool,
+    html_cache_dir: Optional[Path],
+    workers: int,
 ) -> None:
     """Extract text snippets from PDF file for page marker generation.
 
@@ -313,101 +369,86 @@ def extract(
             err=True,
         )
 
-    try:
-        extractor = PDFExtractor(
-            pdf_file,
-            backend=backend,
-            snippet_words=words,
-            strategy=strategy,
-            segment_words=segment_words,
-            language=language,
-            match_html_path=html_file if fuzzy_match else None,
-            exclude_patterns=list(exclude_pattern) if exclude_pattern else None,
-            use_default_excludes=not no_default_excludes,
-            skip_footnotes=not include_footnotes,  # Skip by default, include if flag set
-            min_font_size=min_font_size,
-            complete_words_html_path=html_file if (not fuzzy_match and not raw_pdf) else None,
-            context_words=context_words,
-            two_column=two_column,
+    from .pdf_extractor import PDFExtractor
+
+    extractor = PDFExtractor(
+        pdf_file,
+        backend=backend,
+        snippet_words=words,
+        strategy=strategy,
+        segment_words=segment_words,
+        language=language,
+        match_html_path=html_file if fuzzy_match else None,
+        exclude_patterns=list(exclude_pattern) if exclude_pattern else None,
+        use_default_excludes=not no_default_excludes,
+        skip_footnotes=not include_footnotes,  # Skip by default, include if flag set
+        min_font_size=min_font_size,
+        complete_words_html_path=html_file if (not fuzzy_match and not raw_pdf) else None,
+        context_words=context_words,
+        two_column=two_column,
+        html_cache_dir=html_cache_dir,
+        match_workers=workers,
+        page_workers=workers,
+    )
+
+    # Extract snippets (pages outside the range are skipped entirely)
+    snippets = extractor.extract(start_page=start_page, end_page=end_page)
+
+    if start_page > 1 or end_page is not None:
+        click.echo(
+            f"Filtered to pages {start_page}-{end_page or 'end'}: {len(snippets)} pages"
         )
 
-        # Extract snippets
-        snippets = extractor.extract()
-
-        # Filter by page range if specified
-        if start_page > 1 or end_page is not None:
-            filtered = []
-            for snippet in snippets:
-                page_num = snippet["page"]
-                if page_num >= start_page and (
-                    end_page is None or page_num <= end_page
-                ):
-                    filtered.append(snippet)
-            snippets = filtered
-            click.echo(
-                f"Filtered to pages {start_page}-{end_page or 'end'}: {len(snippets)} pages"
-            )
-
-        # Apply page offset if specified (for magazines with continuing page numbers)
-        if page_offset != 0:
-            for snippet in snippets:
-                snippet["page"] = snippet["page"] + page_offset
-            first_page = snippets[0]["page"] if snippets else start_page + page_offset
-            last_page = snippets[-1]["page"] if snippets else end_page + page_offset if end_page else "end"
-            click.echo(f"Applied page offset {page_offset}: pages now {first_page}-{last_page}")
-
-        # Review mode: show confidence scores
-        if review and segment_words:
-            click.echo("\n" + "=" * 60)
-            click.echo("WORD SEGMENTATION REVIEW")
-            click.echo("=" * 60)
-
-            low_confidence = []
-            for snippet in snippets:
-                conf = snippet.get("confidence", 1.0)
-                if conf < 0.7:
+    # Apply page offset if specified (for magazines with continuing page numbers)
+    if page_offset != 0:
+        for snippet in snippets:
+            snippet["page"] = snippet["page"] + page_offset
+        first_page = snippets[0]["page"] if snippets else start_page + page_offset
+        last_page = snippets[-1]["page"] if snippets else end_page + page_offset if end_page else "end"
+        click.echo(f"Applied page offset {page_offset}: pages now {first_page}-{last_page}")
+
+    # Review mode: show confidence scores
+    if review and segment_words:
+        click.echo("\n" + "=" * 60)
+        click.echo("WORD SEGMENTATION REVIEW")
+        click.echo("=" * 60)
+
+        # Single pass: running total for the average, first 10 low-confidence
+        # snippets for display, and a full count for the "and N more" line
+        total_conf = 0.0
+        low_count = 0
+        low_confidence: List[Dict[str, Any]] = []
+        for snippet in snippets:
+            conf = snippet.get("confidence", 1.0)
+            total_conf += conf
+            if conf < 0.7:
+                low_count += 1
+                if len(low_confidence) < 10:
                     low_confidence.append(snippet)
 
-            if low_confidence:
-                click.echo(f"\n⚠ Found {len(low_confidence)} snippets with low confidence (<0.7):\n")
-                for item in low_confidence[:10]:  # Show first 10
-                    click.echo(f"Page {item['page']}: {item['snippet'][:60]}...")
-                    click.echo(f"  Confidence: {item.get('confidence', 'N/A')}\n")
+        if low_count:
+            click.echo(f"\n⚠ Found {low_count} snippets with low confidence (<0.7):\n")
+            for item in low_confidence:
+                click.echo(f"Page {item['page']}: {item['snippet'][:60]}...")
+                click.echo(f"  Confidence: {item.get('confidence', 'N/A')}\n")
 
-                if len(low_confidence) > 10:
-                    click.echo(f"... and {len(low_confidence) - 10} more\n")
-            else:
-                click.echo("✓ All snippets have high confidence (≥0.7)\n")
+            if low_count > 10:
+                click.echo(f"... and {low_count - 10} more\n")
+        else:
+            click.echo("✓ All snippets have high confidence (≥0.7)\n")
 
-            # Show average confidence
-            confidences = [s.get("confidence", 1.0) for s in snippets]
-            avg_conf = sum(confidences) / len(confidences) if confidences else 0
-            click.echo(f"Average confidence: {avg_conf:.2f}")
-            click.echo("=" * 60 + "\n")
+        # Show average confidence
+        avg_conf = total_conf / len(snippets) if snippets else 0
+        click.echo(f"Average confidence: {avg_conf:.2f}")
+        click.echo("=" * 60 + "\n")
 
-        # Save to JSON
-        extractor.save_to_json(output_json, snippets)
+    # Save to JSON
+    extractor.save_to_json(output_json, snippets)
 
-        # Print statistics
-        extractor.print_stats()
+    # Print statistics
+    extractor.print_stats()
 
-        click.echo(f"\n💡 Next: Validate with 'rx-pagemarker validate {output_json}'")
-
-    except MissingDependencyError as e:
-        click.echo(f"✗ Missing dependency: {e}", err=True)
-        sys.exit(1)
-    except PDFNotFoundError as e:
-        click.echo(f"✗ File not found: {e}", err=True)
-        sys.exit(1)
-    except InvalidParameterError as e:
-        click.echo(f"✗ Invalid parameter: {e}", err=True)
-        sys.exit(1)
-    except PDFExtractionError as e:
-        click.echo(f"✗ Extraction failed: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"✗ Unexpected error: {e}", err=True)
-        sys.exit(1)
+    click.echo(f"\n💡 Next: Validate with 'rx-pagemarker validate {output_json}'")
 
 
 @cli.command()
@@ -424,6 +465,12 @@ def extract(
     is_flag=True,
     help="Show all duplicate snippets (default: first 5)",
 )
+@_handle_errors(
+    {
+        PDFExtractionError: "✗ Validation error:",
+        Exception: "✗ Unexpected error:",
+    }
+)
 def validate(json_file: Path, html: Optional[Path], show_duplicates: bool) -> None:
     """Validate extracted snippets for quality and uniqueness.
 
@@ -443,16 +490,10 @@ def validate(json_file: Path, html: Optional[Path], show_duplicates: bool) -> No
       # Show all duplicates
       rx-pagemarker validate snippets.json -d
     """
-    try:
-        results = validate_snippets(json_file, html)
-        print_validation_results(results)
+    from .pdf_extractor import print_validation_results, validate_snippets
 
-    except PDFExtractionError as e:
-        click.echo(f"✗ Validation error: {e}", err=True)
-        sys.exit(1)
-    except Exception as e:
-        click.echo(f"✗ Unexpected error: {e}", err=True)
-        sys.exit(1)
+    results = validate_snippets(json_file, html)
+    print_validation_results(results)
 
 
 if __name__ == "__main__":
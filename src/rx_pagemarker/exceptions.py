@@ -0,0 +1,29 @@
+"""Exceptions raised by PDF snippet extraction.
+
+Kept free of heavy imports so the CLI can name them without loading the
+PDF extraction module.
+"""
+
+
+class PDFExtractionError(Exception):
+    """Base exception for PDF extraction errors."""
+
+    pass
+
+
+class MissingDependencyError(PDFExtractionError):
+    """Raised when required PDF library is not installed."""
+
+    pass
+
+
+class PDFNotFoundError(PDFExtractionError):
+    """Raised when PDF file is not found."""
+
+    pass
+
+
+class InvalidParameterError(PDFExtractionError):
+    """Raised when invalid parameters are provided."""
+
+    pass
@@ -4,10 +4,21 @@ This module provides functionality to match PDF snippets (with missing spaces)
 against clean HTML text to reconstruct correct word boundaries.
 """
 
+import hashlib
+import json
+import mmap
+import os
 import re
 import unicodedata
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+from operator import sub
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from lxml import etree
 
 try:
     from rapidfuzz import fuzz, process
@@ -16,6 +27,57 @@ try:
 except ImportError:
     HAS_RAPIDFUZZ = False
 
+# Bump when the extracted text or normalization changes, to orphan old caches
+CORPUS_CACHE_VERSION = 3
+
+# Bytes fed to the HTML parser at a time while streaming a file
+_READ_CHUNK_SIZE = 1 << 16
+
+
+class _TextCollector:
+    """lxml parser target that collects text without building a tree.
+
+    Text between two tag, comment or processing-instruction boundaries is
+    one piece (lxml may deliver it in several data() calls); script and
+    style contents are skipped.
+    """
+
+    _SKIP_TAGS = ("script", "style")
+
+    def __init__(self) -> None:
+        self.pieces: List[str] = []
+        self._run: List[str] = []
+        self._skip_depth = 0
+
+    def _flush(self) -> None:
+        if self._run:
+            self.pieces.append("".join(self._run))
+            self._run = []
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        self._flush()
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+
+    def end(self, tag: str) -> None:
+        self._flush()
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._run.append(data)
+
+    def comment(self, text: str) -> None:
+        self._flush()
+
+    def pi(self, target: str, data: Optional[str] = None) -> None:
+        self._flush()
+
+    def close(self) -> List[str]:
+        self._flush()
+        return self.pieces
+
 
 class HTMLMatcherError(Exception):
     """Base exception for HTML matching errors."""
@@ -42,11 +104,24 @@ class HTMLMatcher:
     correct spacing), then returns the HTML version with proper word boundaries.
     """
 
-    def __init__(self, html_path: Union[str, Path]):
+    # Hyphen, em dash and en dash: punctuation that often differs between PDF and HTML.
+    # Final sigma folds to σ because lower() picks ς by word position, which
+    # differs between words lowered one at a time and a snippet lowered whole
+    _MATCH_TRANSLATE_TABLE = str.maketrans(
+        {"-": None, "—": None, "–": None, "ς": "σ"},
+    )
+
+    def __init__(
+        self,
+        html_path: Union[str, Path],
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
         """Initialize HTML matcher.
 
         Args:
             html_path: Path to HTML file with correct text
+            cache_dir: Optional directory for caching the extracted and
+                normalized HTML text between runs, keyed by file content
 
         Raises:
             HTMLNotFoundError: If HTML file doesn't exist
@@ -61,8 +136,31 @@ class HTMLMatcher:
         if not self.html_path.exists():
             raise HTMLNotFoundError(f"HTML file not found: {self.html_path}")
 
-        self.html_text = self._load_html()
-        self.html_no_spaces = self._normalize_text(self.html_text.replace(" ", ""))
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Hash the file once; the path serves both the read and a later write
+        cache_path = self._corpus_cache_path(self.cache_dir) if self.cache_dir else None
+        cached = self._read_corpus_cache(cache_path) if cache_path else None
+
+        self.html_text = cached[0] if cached else self._load_html()
+
+        # Per-word normalized text and prefix lengths, so the normalized
+        # length of any word window is a single subtraction
+        self._html_words: List[str] = self.html_text.split()
+        self._norm_words: List[str] = (
+            cached[1] if cached else [self._normalize_text(w) for w in self._html_words]
+        )
+        self._cum_lens: List[int] = [0, *accumulate(map(len, self._norm_words))]
+        # All normalized words joined, so a window is one slice between prefix lengths
+        self._norm_joined: str = "".join(self._norm_words)
+        # Kept for compatibility; shares the joined string instead of a second copy
+        self.html_no_spaces = self._norm_joined
+
+        if cache_path and not cached:
+            self._write_corpus_cache(cache_path)
+
+        # Running heads and repeated end-of-page text normalize to the same
+        # query, so cache window search results per normalized snippet
+        self._match_cache = lru_cache(maxsize=4096)(self._find_best_substring_match)
 
         # Common PDF footer/header patterns to remove
         self.noise_patterns = [
@@ -71,15 +169,29 @@ class HTMLMatcher:
             r"Page\s+\d+",  # Simple page numbers
             r"\d{1,2}/\d{1,2}/\d{2,4}\s+\d{1,2}:\d{2}\s+[AP]M",  # Timestamps
         ]
+        # One alternation, tried in the order above, so snippets are scanned once
+        self._noise_re = re.compile(
+            "|".join(f"(?:{p})" for p in self.noise_patterns), re.IGNORECASE
+        )
+        self._ws_re = re.compile(r"\s+")
 
     def _load_html(self) -> str:
         """Load and extract text from HTML file."""
         try:
-            with open(self.html_path, "r", encoding="utf-8") as f:
-                html_content = f.read()
-
-            # Simple HTML tag removal (could use BeautifulSoup for complex HTML)
-            text = re.sub(r"<[^>]+>", " ", html_content)
+            # Stream the file through lxml's HTML parser into a text-only
+            # target: entities are decoded, ">" inside attribute values
+            # can't end a tag early, and no tree is kept in memory
+            parser = etree.HTMLParser(target=_TextCollector(), encoding="utf-8")
+            fed = False
+            with open(self.html_path, "rb") as f:
+                for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+                    parser.feed(chunk)
+                    fed = True
+            if not fed:
+                return ""
+
+            # Separate text pieces with spaces, as tag boundaries did before
+            text = " ".join(parser.close())
 
             # Clean up whitespace
             text = re.sub(r"\s+", " ", text)
@@ -89,20 +201,69 @@ class HTMLMatcher:
         except Exception as e:
             raise HTMLMatcherError(f"Error loading HTML: {e}") from e
 
-    def _normalize_text(self, text: str) -> str:
-        """Normalize text for matching (Unicode normalization, lowercase)."""
-        # Normalize Unicode
-        text = unicodedata.normalize("NFC", text)
+    def _corpus_cache_path(self, cache_dir: Path) -> Optional[Path]:
+        """Return the cache file path for the current HTML file content.
 
-        # Convert to lowercase for case-insensitive matching
-        text = text.lower()
+        Returns None if the HTML file can't be read, which disables caching.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(self.html_path, "rb") as f:
+                # Hash straight from the page cache instead of copying the whole
+                # file into a bytes object; mmap refuses empty files
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        digest.update(mm)
+        except OSError:
+            return None
+        digest.update(str(CORPUS_CACHE_VERSION).encode())
+        return cache_dir / f"{digest.hexdigest()}.json"
+
+    def _read_corpus_cache(self, cache_path: Path) -> Optional[Tuple[str, List[str]]]:
+        """Load cached (html_text, normalized words), or None on a miss.
+
+        Unreadable or malformed cache files count as a miss and are
+        overwritten by the next write.
+        """
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            html_text, norm_words = data["html_text"], data["norm_words"]
+            if not (
+                isinstance(html_text, str)
+                and isinstance(norm_words, list)
+                and all(isinstance(w, str) for w in norm_words)
+                and len(norm_words) == len(html_text.split())
+            ):
+                return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+        return html_text, norm_words
+
+    def _write_corpus_cache(self, cache_path: Path) -> None:
+        """Store the extracted and normalized HTML text at cache_path."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"html_text": self.html_text, "norm_words": self._norm_words},
+                    f,
+                    ensure_ascii=False,
+                )
+        except OSError:
+            pass  # Caching is best-effort; matching works without it
 
-        # Remove common punctuation that might differ
-        text = text.replace("-", "")
-        text = text.replace("—", "")
-        text = text.replace("–", "")
+    def _normalize_text(self, text: str) -> str:
+        """Normalize text for matching (Unicode normalization, lowercase).
 
-        return text
+        Common dashes are deleted and final sigma is folded in a single
+        translate() pass.
+        """
+        return (
+            unicodedata.normalize("NFC", text)
+            .lower()
+            .translate(self._MATCH_TRANSLATE_TABLE)
+        )
 
     def clean_pdf_snippet(self, snippet: str) -> str:
         """Remove PDF-specific noise (page numbers, footers, layout markers).
@@ -113,20 +274,17 @@ class HTMLMatcher:
         Returns:
             Cleaned snippet with noise removed
         """
-        cleaned = snippet
-
-        # Apply all noise patterns
-        for pattern in self.noise_patterns:
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+        # Remove all noise patterns in a single pass
+        cleaned = self._noise_re.sub("", snippet)
 
         # Remove extra whitespace
-        cleaned = re.sub(r"\s+", " ", cleaned)
+        cleaned = self._ws_re.sub(" ", cleaned)
 
         return cleaned.strip()
 
     def find_match(
         self, pdf_snippet: str, min_confidence: float = 0.6
-    ) -> Dict[str, any]:
+    ) -> Dict[str, Any]:
         """Find best matching text in HTML for the given PDF snippet.
 
         Args:
@@ -151,7 +309,7 @@ class HTMLMatcher:
             }
 
         # Find best match using sliding window approach
-        best_match, best_score = self._find_best_substring_match(cleaned_normalized)
+        best_match, best_score = self._match_cache(cleaned_normalized)
 
         # Convert score to 0-1 confidence
         confidence = best_score / 100.0
@@ -169,6 +327,43 @@ class HTMLMatcher:
             "cleaned_snippet": cleaned,
         }
 
+    def find_match_batch(
+        self,
+        pdf_snippets: List[str],
+        min_confidence: float = 0.6,
+        workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find HTML matches for many PDF snippets, optionally in parallel.
+
+        Each worker process builds its own HTMLMatcher once (reusing the
+        corpus cache if cache_dir is set) and then matches chunks of
+        snippets, so the HTML is not re-sent or re-parsed per snippet.
+
+        Args:
+            pdf_snippets: Raw PDF snippets to match
+            min_confidence: Minimum confidence threshold (0-1)
+            workers: Number of worker processes (None or 1 matches serially)
+
+        Returns:
+            List of find_match() results, in the same order as pdf_snippets
+        """
+        if not workers or workers <= 1 or len(pdf_snippets) <= 1:
+            return [self.find_match(s, min_confidence) for s in pdf_snippets]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_match_worker,
+            initargs=(self.html_path, self.cache_dir),
+        ) as executor:
+            return list(
+                executor.map(
+                    _match_in_worker,
+                    pdf_snippets,
+                    [min_confidence] * len(pdf_snippets),
+                    chunksize=16,
+                )
+            )
+
     def _find_best_substring_match(
         self, query_no_spaces: str, window_ratio: float = 1.5
     ) -> Tuple[str, float]:
@@ -182,38 +377,114 @@ class HTMLMatcher:
             Tuple of (best_match_text_with_spaces, confidence_score)
         """
         query_len = len(query_no_spaces)
-        window_size = int(query_len * window_ratio)
-
-        # Split HTML into words for reconstruction
-        html_words = self.html_text.split()
+        html_words = self._html_words
+        norm_joined = self._norm_joined
+        cum_lens = self._cum_lens
+        total_words = len(html_words)
+
+        # Fast path: the query occurs verbatim, starting and ending on word
+        # boundaries (PDF text that only lost its spaces); no fuzzy scan needed
+        exact = self._find_exact_word_match(query_no_spaces)
+        if exact is not None:
+            return exact, 100.0
+
+        # Windows whose normalized length is more than 50% off the query
+        # length are never scored. Sizes are tried in ascending order, as
+        # the original scan did; for each size, the window lengths of every
+        # start come from one subtraction of shifted prefix lengths (map runs
+        # in C), and only starts inside the band become candidates. Window
+        # lengths are ints, so the band is rounded inward to int bounds
+        # (same windows, and the per-start comparisons avoid int/float mixing).
+        min_len = query_len - query_len // 2
+        max_len = query_len + query_len // 2
 
         best_score = 0
-        best_match = ""
+        best_start = best_size = 0
+
+        for num_words in range(max(1, query_len // 20), total_words):
+            lengths = list(map(sub, cum_lens[num_words:], cum_lens))
+
+            # Every window of this size is already too long, and windows only
+            # grow with more words: no later size can fit the band either
+            if min(lengths) > max_len:
+                break
+
+            starts = [
+                i for i, length in enumerate(lengths) if min_len <= length <= max_len
+            ]
+            if not starts:
+                continue
+            candidates = [
+                norm_joined[cum_lens[i] : cum_lens[i + num_words]] for i in starts
+            ]
+
+            # Best window of this size, scored in C; score_cutoff lets
+            # rapidfuzz skip windows that cannot beat the current best
+            result = process.extractOne(
+                query_no_spaces, candidates, scorer=fuzz.ratio, score_cutoff=best_score
+            )
+            if result is None or result[1] <= best_score:
+                continue
 
-        # Try different window sizes
-        for num_words in range(max(1, len(query_no_spaces) // 20), len(html_words)):
-            for i in range(len(html_words) - num_words + 1):
-                # Get window of words
-                window_words = html_words[i : i + num_words]
-                window_text = " ".join(window_words)
-                window_normalized = self._normalize_text(window_text.replace(" ", ""))
+            best_score = result[1]
+            best_start, best_size = starts[result[2]], num_words
 
-                # Skip if length difference is too large
-                if abs(len(window_normalized) - query_len) > query_len * 0.5:
-                    continue
+            # Early exit if we found excellent match
+            if best_score > 95:
+                break
 
-                # Calculate similarity
-                score = fuzz.ratio(query_no_spaces, window_normalized)
+        # Rebuild the spaced HTML text only for the winning window
+        best_match = " ".join(html_words[best_start : best_start + best_size])
+        return best_match, best_score
 
-                if score > best_score:
-                    best_score = score
-                    best_match = window_text
+    def _find_exact_word_match(self, query_no_spaces: str) -> Optional[str]:
+        """Find the query verbatim in the joined normalized words.
 
-                # Early exit if we found excellent match
-                if score > 95:
-                    return best_match, score
+        Only occurrences that start and end on word boundaries count, so the
+        result is a whole-word window that fuzz.ratio would score 100.
 
-        return best_match, best_score
+        Args:
+            query_no_spaces: Normalized query text without spaces
+
+        Returns:
+            The matching HTML words joined with spaces, or None if not found
+        """
+        if not query_no_spaces:
+            return None
+
+        cum_lens = self._cum_lens
+        pos = self._norm_joined.find(query_no_spaces)
+        while pos != -1:
+            end = pos + len(query_no_spaces)
+            # Last word starting at pos / first word ending at end, so words
+            # that normalize to nothing (lone dashes) are not included
+            start_word = bisect_right(cum_lens, pos) - 1
+            end_word = bisect_left(cum_lens, end)
+            if (
+                cum_lens[start_word] == pos
+                and end_word < len(cum_lens)
+                and cum_lens[end_word] == end
+            ):
+                return " ".join(self._html_words[start_word:end_word])
+            pos = self._norm_joined.find(query_no_spaces, pos + 1)
+
+        return None
+
+
+# Per-process matcher used by find_match_batch workers
+_worker_matcher: Optional[HTMLMatcher] = None
+
+
+def _init_match_worker(html_path: Path, cache_dir: Optional[Path]) -> None:
+    """Build the worker process's HTMLMatcher once."""
+    global _worker_matcher
+    _worker_matcher = HTMLMatcher(html_path, cache_dir=cache_dir)
+
+
+def _match_in_worker(pdf_snippet: str, min_confidence: float) -> Dict[str, Any]:
+    """Match one snippet with the worker process's HTMLMatcher."""
+    assert _worker_matcher is not None, "worker initializer did not run"
+    return _worker_matcher.find_match(pdf_snippet, min_confidence)
 
 
 def match_snippet(
@@ -4,12 +4,67 @@ import json
 import re
 import sys
 import unicodedata
+from bisect import bisect_left
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union, cast
 
 from bs4 import BeautifulSoup, NavigableString, Tag
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Per-container text index: (combined_text, node_start_offsets, text_nodes)
+ContainerIndex = Tuple[str, List[int], List[NavigableString]]
+
+# Prefix shared by the unfilled placeholders written by generate/extract
+PLACEHOLDER_PREFIX = "PASTE_TEXT_"
+
+# Block-level tags that can hold a page marker's snippet text
+CONTAINER_TYPES = frozenset([
+    "p", "div", "td", "th", "li", "dd", "dt",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+    "blockquote", "aside", "article", "section",
+])
+
+# Elements whose text is never searched
+SKIP_PARENTS = frozenset(["script", "style", "head"])
+
+# Buffered progress lines written at once when stdout is a terminal
+TTY_FLUSH_LINES = 50
+
+
+class _CombiningMarkTable(dict):
+    """str.translate table that deletes combining marks (category Mn).
+
+    Code points are classified on first lookup and remembered, so each
+    distinct character costs one unicodedata.category() call.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
+        value = None if unicodedata.category(char) == "Mn" else char
+        self[codepoint] = value
+        return value
+
+
+_STRIP_COMBINING_MARKS = _CombiningMarkTable()
+
+
+def _page_sort_key(entry: Dict[str, Any]) -> Tuple[int, str]:
+    """Sort key for page references: numeric pages by value, others first.
+
+    Handles both numeric and roman numeral pages; the page is read and
+    converted to text once per entry.
+    """
+    page = str(entry.get("page", ""))
+    return (int(page) if page.isdigit() else 0, page)
+
 
 class PageMarkerInserter:
     """Handles insertion of page markers into HTML content.
@@ -24,6 +79,8 @@ class PageMarkerInserter:
         json_path: Union[str, Path],
         output_path: Optional[Union[str, Path]] = None,
         inject_css: bool = False,
+        verbose: bool = False,
+        parser: str = "html.parser",
     ) -> None:
         """Initialize the page marker inserter.
 
@@ -32,6 +89,9 @@ class PageMarkerInserter:
             json_path: Path to JSON file with page references
             output_path: Path for output HTML (default: input_with_pages.html)
             inject_css: Whether to inject CSS styling for visible page markers
+            verbose: Print per-page progress as it happens instead of
+                     buffering it until the end of process()
+            parser: BeautifulSoup tree builder, "html.parser" or "lxml"
         """
         self.html_path = Path(html_path)
         self.json_path = Path(json_path)
@@ -41,6 +101,8 @@ class PageMarkerInserter:
             else self.html_path.parent / f"{self.html_path.stem}_with_pages.html"
         )
         self.inject_css = inject_css
+        self.verbose = verbose
+        self.parser = parser
 
         self.soup: Optional[BeautifulSoup] = None
         self.page_references: List[Dict[str, Any]] = []
@@ -55,6 +117,29 @@ class PageMarkerInserter:
         self._last_insertion_container_idx: int = -1
         self._last_insertion_position: int = 0  # Position within the container
         self._containers: Optional[List[Tag]] = None
+        self._container_index: Optional[List[Optional[ContainerIndex]]] = None
+        # Markers inserted so far, in document order, with their numeric page
+        # (None for non-numeric pages such as roman numerals)
+        self._inserted_markers: List[Tuple[Optional[int], Tag]] = []
+        # Per-page progress lines, buffered while process() runs
+        self._log: Optional[List[str]] = None
+        # Flush the buffer every TTY_FLUSH_LINES lines (interactive runs only)
+        self._log_flush_every: Optional[int] = None
+
+    def _emit(self, line: str) -> None:
+        """Print a per-page progress line, or buffer it during process()."""
+        if self._log is None or self.verbose:
+            print(line)
+            return
+        self._log.append(line)
+        if self._log_flush_every and len(self._log) >= self._log_flush_every:
+            self._flush_log()
+
+    def _flush_log(self) -> None:
+        """Write buffered progress lines in one call and clear the buffer."""
+        if self._log:
+            sys.stdout.write("\n".join(self._log) + "\n")
+            self._log.clear()
 
     def load_html(self) -> None:
         """Load and parse the HTML file.
@@ -65,8 +150,13 @@ class PageMarkerInserter:
         try:
             with open(self.html_path, "r", encoding="utf-8") as f:
                 content = f.read()
-            # Use html.parser to preserve original formatting (lxml reorders attributes)
-            self.soup = BeautifulSoup(content, "html.parser")
+            # html.parser (the default) keeps fragments as written; lxml parses
+            # much faster but wraps fragments in <html><body> and repairs markup
+            self.soup = BeautifulSoup(content, self.parser)
+            # Container list and text index belong to the previous tree
+            self._containers = None
+            self._container_index = None
+            self._inserted_markers = []
             print(f"✓ Loaded HTML from {self.html_path}")
         except FileNotFoundError:
             print(f"✗ Error: HTML file not found: {self.html_path}")
@@ -82,8 +172,10 @@ class PageMarkerInserter:
             SystemExit: If file not found or JSON parsing fails
         """
         try:
-            with open(self.json_path, "r", encoding="utf-8") as f:
-                self.page_references = json.load(f)
+            with open(self.json_path, "rb") as f:
+                raw = f.read()
+            # orjson is a faster drop-in when installed (pip install rx-pagemarker[fast])
+            self.page_references = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
             print(
                 f"✓ Loaded {len(self.page_references)} page references from {self.json_path}"
             )
@@ -99,6 +191,28 @@ class PageMarkerInserter:
             print(f"✗ Error parsing JSON: {e}")
             sys.exit(1)
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_snippet(snippet: str) -> Tuple[str, int]:
+        """Split a snippet into the text to search for and the marker offset.
+
+        A "|" marks the page break inside the snippet: "word1 word2|word3"
+        searches for "word1 word2 word3" and places the marker at the "|".
+        Without one, the marker goes after the whole snippet.
+
+        Args:
+            snippet: Text snippet (may contain | for page break)
+
+        Returns:
+            Tuple of (search_snippet, marker_offset)
+        """
+        if "|" in snippet:
+            snippet_before, snippet_after = snippet.split("|", 1)
+            snippet_before = snippet_before.strip()
+            search_snippet = f"{snippet_before} {snippet_after.strip()}".strip()
+            return (search_snippet, len(snippet_before))
+        return (snippet, len(snippet))
+
     def _get_containers(self) -> List[Tag]:
         """Get all content containers in document order (cached).
 
@@ -114,27 +228,159 @@ class PageMarkerInserter:
         if self.soup is None:
             raise ValueError("HTML not loaded. Call load_html() first.")
 
-        container_types = [
-            "p", "div", "td", "th", "li", "dd", "dt",
-            "h1", "h2", "h3", "h4", "h5", "h6",
-            "blockquote", "aside", "article", "section",
-        ]
+        all_containers = self.soup.find_all(CONTAINER_TYPES)
+
+        # Containers inside non-content elements, collected in one pass
+        # instead of a find_parent() walk per container
+        excluded = {
+            id(c)
+            for skipped in self.soup.find_all(SKIP_PARENTS)
+            for c in skipped.find_all(CONTAINER_TYPES)
+        }
 
-        all_containers = self.soup.find_all(container_types)
+        # Filter to leaf containers only. Every container marks its nearest
+        # container ancestor as non-leaf; outer ancestors are marked in turn
+        # by that ancestor, so no per-container subtree search is needed
+        has_inner = set()
+        for c in all_containers:
+            parent = c.parent
+            while parent is not None and parent.name not in CONTAINER_TYPES:
+                parent = parent.parent
+            if parent is not None:
+                has_inner.add(id(parent))
 
-        # Filter to leaf containers only
         self._containers = [
             c for c in all_containers
-            if not c.find_parent(["script", "style", "head"])
-            and not c.find(container_types)
+            if id(c) not in excluded and id(c) not in has_inner
         ]
 
         return self._containers
 
-    def _normalize_word(self, word: str) -> str:
+    def _index_container(self, container: Tag) -> ContainerIndex:
+        """Walk a container once and record where each text node starts.
+
+        Args:
+            container: Container tag to index
+
+        Returns:
+            Tuple of (combined_text, node_start_offsets, text_nodes)
+        """
+        starts: List[int] = []
+        nodes: List[NavigableString] = []
+        current_pos = 0
+
+        # .strings yields only text nodes (the same ones get_text() joins)
+        for node in cast(Iterator[NavigableString], container.strings):
+            # Skip non-content elements
+            if node.parent.name in SKIP_PARENTS:
+                continue
+            starts.append(current_pos)
+            nodes.append(node)
+            current_pos += len(node)
+
+        return ("".join(nodes), starts, nodes)
+
+    def _get_container_entry(self, container_idx: int) -> ContainerIndex:
+        """Get the text index for one container, building it on first use.
+
+        Entries are invalidated (set to None) when a marker is inserted into
+        the container and rebuilt lazily the next time they are needed.
+
+        Args:
+            container_idx: Index of the container
+
+        Returns:
+            Tuple of (combined_text, node_start_offsets, text_nodes)
+        """
+        containers = self._get_containers()
+        if self._container_index is None:
+            self._container_index = [None] * len(containers)
+
+        entry = self._container_index[container_idx]
+        if entry is None:
+            entry = self._index_container(containers[container_idx])
+            self._container_index[container_idx] = entry
+        return entry
+
+    def _invalidate_container(self, container_idx: int) -> None:
+        """Mark a container's text index as stale after modifying it."""
+        if self._container_index is not None:
+            self._container_index[container_idx] = None
+
+    def _splice_container_entry(
+        self,
+        container_idx: int,
+        marker_position: int,
+        old_node: NavigableString,
+        new_nodes: List[NavigableString],
+    ) -> None:
+        """Patch a container's text index after one text node was replaced.
+
+        Splices the replacement nodes into the cached entry and shifts the
+        offsets after them, instead of walking the container again. Falls
+        back to invalidating the entry if it doesn't hold the old node.
+
+        Args:
+            container_idx: Index of the modified container
+            marker_position: Position within the container's combined text
+                             that fell inside the old node
+            old_node: Text node that was replaced
+            new_nodes: Text nodes now in its place, in document order
+        """
+        index = self._container_index
+        entry = index[container_idx] if index else None
+        if index is None or entry is None:
+            return
+
+        combined_text, starts, nodes = entry
+        i = bisect_left(starts, marker_position) - 1
+        if i < 0 or nodes[i] is not old_node:
+            self._invalidate_container(container_idx)
+            return
+
+        start = starts[i]
+        new_starts = []
+        pos = start
+        for node in new_nodes:
+            new_starts.append(pos)
+            pos += len(node)
+        delta = pos - start - len(old_node)
+
+        index[container_idx] = (
+            combined_text[:start] + "".join(new_nodes) + combined_text[start + len(old_node):],
+            starts[:i] + new_starts + [s + delta for s in starts[i + 1:]],
+            nodes[:i] + new_nodes + nodes[i + 1:],
+        )
+
+    def _locate_text_node(
+        self, container_idx: int, marker_position: int
+    ) -> Tuple[Optional[NavigableString], Optional[int]]:
+        """Map a position in a container's combined text to a text node.
+
+        Args:
+            container_idx: Index of the container
+            marker_position: Position within the container's combined text
+
+        Returns:
+            Tuple of (text_node, position_in_node) or (None, None) if out of range
+        """
+        _, starts, nodes = self._get_container_entry(container_idx)
+
+        # Last node starting before the marker position
+        i = bisect_left(starts, marker_position) - 1
+        if i < 0 or marker_position > starts[i] + len(nodes[i]):
+            return (None, None)
+
+        return (nodes[i], marker_position - starts[i])
+
+    @staticmethod
+    @lru_cache(maxsize=65536)
+    def _normalize_word(word: str) -> str:
         """Normalize a word for comparison by removing accents and lowercasing.
 
         Handles Greek accents (tonos, dialytika) for better matching.
+        Results are cached, since the same context words are compared
+        against many candidate positions.
 
         Args:
             word: Word to normalize
@@ -142,10 +388,13 @@ class PageMarkerInserter:
         Returns:
             Normalized word (lowercase, no accents)
         """
+        # ASCII words have no combining marks to strip
+        if word.isascii():
+            return word.lower()
         # NFD decomposition separates base characters from combining marks
         normalized = unicodedata.normalize("NFD", word.lower())
         # Remove combining diacritical marks (accents)
-        return "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+        return normalized.translate(_STRIP_COMBINING_MARKS)
 
     def _jaccard_similarity(self, words1: List[str], words2: List[str]) -> float:
         """Calculate Jaccard similarity between two word lists.
@@ -159,16 +408,31 @@ class PageMarkerInserter:
         Returns:
             Similarity score between 0.0 and 1.0
         """
-        if not words1 or not words2:
-            return 0.0
+        return self._set_similarity(
+            frozenset(map(self._normalize_word, words1)),
+            frozenset(map(self._normalize_word, words2)),
+        )
 
-        set1 = {self._normalize_word(w) for w in words1}
-        set2 = {self._normalize_word(w) for w in words2}
+    @staticmethod
+    def _set_similarity(set1: FrozenSet[str], set2: FrozenSet[str]) -> float:
+        """Calculate Jaccard similarity between two sets of normalized words."""
+        if not set1 or not set2:
+            return 0.0
 
         intersection = len(set1 & set2)
         union = len(set1 | set2)
 
-        return intersection / union if union > 0 else 0.0
+        return intersection / union
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _context_word_set(text: str) -> FrozenSet[str]:
+        """Split context text into a set of normalized words.
+
+        Cached, so the expected context of a page is normalized once no
+        matter how many candidate locations it is scored against.
+        """
+        return frozenset(map(PageMarkerInserter._normalize_word, text.split()))
 
     def _extract_html_context(
         self, container_text: str, position: int, snippet_len: int, num_words: int = 4
@@ -184,15 +448,15 @@ class PageMarkerInserter:
         Returns:
             Tuple of (context_before, context_after)
         """
-        # Text before the snippet
+        # Text before the snippet; split off only the last num_words words
         text_before = container_text[:position]
-        words_before = text_before.split()
-        context_before = " ".join(words_before[-num_words:]) if words_before else ""
+        words_before = text_before.rsplit(None, num_words)[-num_words:]
+        context_before = " ".join(words_before)
 
-        # Text after the snippet
+        # Text after the snippet; split off only the first num_words words
         text_after = container_text[position + snippet_len:]
-        words_after = text_after.split()
-        context_after = " ".join(words_after[:num_words]) if words_after else ""
+        words_after = text_after.split(None, num_words)[:num_words]
+        context_after = " ".join(words_after)
 
         return (context_before, context_after)
 
@@ -224,13 +488,12 @@ class PageMarkerInserter:
             container_text, position, snippet_len
         )
 
-        before_words = expected_before.split() if expected_before else []
-        after_words = expected_after.split() if expected_after else []
-        actual_before_words = actual_before.split()
-        actual_after_words = actual_after.split()
-
-        before_score = self._jaccard_similarity(before_words, actual_before_words)
-        after_score = self._jaccard_similarity(after_words, actual_after_words)
+        before_score = self._set_similarity(
+            self._context_word_set(expected_before), self._context_word_set(actual_before)
+        )
+        after_score = self._set_similarity(
+            self._context_word_set(expected_after), self._context_word_set(actual_after)
+        )
 
         # Weighted average of before/after scores (40/60 split, empirically chosen)
         # If only one context is available, use just that one
@@ -260,31 +523,29 @@ class PageMarkerInserter:
                            marker_position, container_text)
         """
         # Handle page break marker
-        if "|" in snippet:
-            parts = snippet.split("|", 1)
-            snippet_before = parts[0].strip()
-            snippet_after = parts[1].strip() if len(parts) > 1 else ""
-            search_snippet = f"{snippet_before} {snippet_after}".strip()
-            marker_offset = len(snippet_before)
-        else:
-            search_snippet = snippet
-            marker_offset = len(snippet)
+        search_snippet, marker_offset = self._parse_snippet(snippet)
 
         if self.soup is None:
             raise ValueError("HTML not loaded. Call load_html() first.")
 
         containers = self._get_containers()
+        snippet_len = len(search_snippet)
         locations = []
 
-        for idx, container in enumerate(containers):
-            # Skip containers before our current position
-            if idx < search_after_idx:
+        for idx in range(max(search_after_idx, 0), len(containers)):
+            combined_text = self._get_container_entry(idx)[0]
+
+            # Too short to contain the snippet: skip without searching
+            if len(combined_text) < snippet_len:
                 continue
 
-            combined_text = container.get_text()
+            # If same container as last insertion, the marker must land after
+            # that position: start the search at the first qualifying offset
+            start_pos = 0
+            if idx == search_after_idx:
+                start_pos = max(0, search_after_pos - marker_offset + 1)
 
             # Find ALL occurrences in this container
-            start_pos = 0
             while True:
                 snippet_start = combined_text.find(search_snippet, start_pos)
                 if snippet_start == -1:
@@ -292,30 +553,12 @@ class PageMarkerInserter:
 
                 marker_position = snippet_start + marker_offset
 
-                # If same container as last insertion, must be after that position
-                if idx == search_after_idx and marker_position <= search_after_pos:
-                    start_pos = snippet_start + 1
-                    continue
-
-                # Walk through all text nodes to find where marker should go
-                current_pos = 0
-
-                for node in container.descendants:
-                    if isinstance(node, NavigableString):
-                        if node.parent.name in ["script", "style", "head"]:
-                            continue
-
-                        node_text = str(node)
-                        node_length = len(node_text)
-
-                        if current_pos < marker_position <= current_pos + node_length:
-                            position_in_node = marker_position - current_pos
-                            locations.append((
-                                node, position_in_node, idx, marker_position, combined_text
-                            ))
-                            break
-
-                        current_pos += node_length
+                # Resolve the text node where the marker should go
+                node, position_in_node = self._locate_text_node(idx, marker_position)
+                if node is not None and position_in_node is not None:
+                    locations.append((
+                        node, position_in_node, idx, marker_position, combined_text
+                    ))
 
                 start_pos = snippet_start + 1
 
@@ -375,109 +618,147 @@ class PageMarkerInserter:
             Tuple of (text_node, position_in_node, container_index, marker_position)
             or (None, None, -1, 0) if not found
         """
-        # Handle page break marker - split into before/after parts
-        if "|" in snippet:
-            parts = snippet.split("|", 1)
-            snippet_before = parts[0].strip()
-            snippet_after = parts[1].strip() if len(parts) > 1 else ""
-            # Search for combined context (without the |)
-            search_snippet = f"{snippet_before} {snippet_after}".strip()
-            # Position at the | marker
-            marker_offset = len(snippet_before)
-        else:
-            search_snippet = snippet
-            # Marker goes AFTER snippet
-            marker_offset = len(snippet)
+        # Handle page break marker: search without the "|", mark at its position
+        search_snippet, marker_offset = self._parse_snippet(snippet)
 
         if self.soup is None:
             raise ValueError("HTML not loaded. Call load_html() first.")
 
         containers = self._get_containers()
+        snippet_len = len(search_snippet)
+
+        for idx in range(max(search_after_idx, 0), len(containers)):
+            # Combined text from this container (all tags stripped)
+            combined_text = self._get_container_entry(idx)[0]
 
-        for idx, container in enumerate(containers):
-            # Skip containers before our current position
-            if idx < search_after_idx:
+            # Too short to contain the snippet: skip without searching
+            if len(combined_text) < snippet_len:
                 continue
 
-            # Get combined text from this container (strips all tags)
-            combined_text = container.get_text()
+            # Single scan: find() returns -1 when the snippet is absent
+            snippet_start = combined_text.find(search_snippet)
+            if snippet_start == -1:
+                continue
 
-            # Check if snippet exists in the combined text
-            if search_snippet in combined_text:
-                snippet_start = combined_text.find(search_snippet)
-                # marker_position is where the page break marker should go
-                # (after snippet_before, not after the full search_snippet)
+            # marker_position is where the page break marker should go
+            # (after snippet_before, not after the full search_snippet)
+            marker_position = snippet_start + marker_offset
+
+            # If same container as last insertion, must be after that position
+            if idx == search_after_idx and marker_position <= search_after_pos:
+                # Snippet is before our last insertion point, try to find later occurrence
+                later_start = combined_text.find(search_snippet, search_after_pos)
+                if later_start == -1:
+                    continue  # No later occurrence in this container
+                snippet_start = later_start
                 marker_position = snippet_start + marker_offset
 
-                # If same container as last insertion, must be after that position
-                if idx == search_after_idx and marker_position <= search_after_pos:
-                    # Snippet is before our last insertion point, try to find later occurrence
-                    later_start = combined_text.find(search_snippet, search_after_pos)
-                    if later_start == -1:
-                        continue  # No later occurrence in this container
-                    snippet_start = later_start
-                    marker_position = snippet_start + marker_offset
+            # Resolve the text node where the marker should go
+            node, position_in_node = self._locate_text_node(idx, marker_position)
+            if node is not None:
+                return (node, position_in_node, idx, marker_position)
+
+        return (None, None, -1, 0)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _loose_snippet_pattern(snippet: str) -> Optional["re.Pattern[str]"]:
+        """Compile a snippet into a pattern where any whitespace run matches any other.
+
+        Group 1 ends where the marker goes (the "|" break, or the end of
+        the snippet).
+
+        Args:
+            snippet: Text snippet (may contain | for page break)
+
+        Returns:
+            Compiled pattern, or None if the snippet has no words
+        """
+        before, sep, after = snippet.partition("|")
+        before_words = before.split()
+        after_words = after.split()
+        if not before_words:
+            return None
+
+        pattern = "(" + r"\s+".join(map(re.escape, before_words)) + ")"
+        if sep and after_words:
+            pattern += r"\s*" + r"\s+".join(map(re.escape, after_words))
+        return re.compile(pattern)
+
+    def find_snippet_location_loose(
+        self, snippet: str, search_after_idx: int = -1, search_after_pos: int = 0
+    ) -> Tuple[Optional[NavigableString], Optional[int], int, int]:
+        """Find where to place a marker, ignoring differences in whitespace.
 
-                # Walk through all text nodes to find where marker should go
-                current_pos = 0
+        Fallback for snippets that fail the exact search because PDF text
+        and HTML break or repeat spaces differently. Positions are taken
+        from the container's original text, so markers land exactly as
+        with an exact match.
 
-                for node in container.descendants:
-                    if isinstance(node, NavigableString):
-                        # Skip non-content elements
-                        if node.parent.name in ["script", "style", "head"]:
-                            continue
+        Args:
+            snippet: Text snippet to search for (may contain | for page break)
+            search_after_idx: Container index of last insertion
+            search_after_pos: Position within that container of last insertion
 
-                        node_text = str(node)
-                        node_length = len(node_text)
+        Returns:
+            Tuple of (text_node, position_in_node, container_index, marker_position)
+            or (None, None, -1, 0) if not found
+        """
+        pattern = self._loose_snippet_pattern(snippet)
+        if pattern is None:
+            return (None, None, -1, 0)
 
-                        # Check if marker position is within this text node
-                        if current_pos < marker_position <= current_pos + node_length:
-                            # Calculate position within this specific node
-                            position_in_node = marker_position - current_pos
-                            return (node, position_in_node, idx, marker_position)
+        if self.soup is None:
+            raise ValueError("HTML not loaded. Call load_html() first.")
 
-                        current_pos += node_length
+        containers = self._get_containers()
+
+        for idx in range(max(search_after_idx, 0), len(containers)):
+            combined_text = self._get_container_entry(idx)[0]
+
+            start_pos = 0
+            while True:
+                match = pattern.search(combined_text, start_pos)
+                if match is None:
+                    break
+
+                marker_position = match.end(1)
+                # If same container as last insertion, must be after that position
+                if idx == search_after_idx and marker_position <= search_after_pos:
+                    start_pos = match.start() + 1
+                    continue
+
+                node, position_in_node = self._locate_text_node(idx, marker_position)
+                if node is not None:
+                    return (node, position_in_node, idx, marker_position)
+                break
 
         return (None, None, -1, 0)
 
-    def insert_page_marker(
+    def _locate_marker(
         self,
         page_number: Union[str, int],
         snippet: str,
-        context_before: Optional[str] = None,
-        context_after: Optional[str] = None,
-        occurrence: int = 1,
-    ) -> bool:
-        """Insert a page marker after the specified snippet.
-
-        Uses sequential position tracking: each marker is only placed AFTER
-        the previous marker's position in the document. This ensures correct
-        ordering even when snippet text appears multiple times, including
-        multiple page breaks within the same paragraph.
+        context_before: Optional[str],
+        context_after: Optional[str],
+    ) -> Tuple[Optional[NavigableString], Optional[int], int, int]:
+        """Find where the marker for a snippet goes, after the last insertion.
 
-        When context is provided and multiple matches exist, uses Jaccard
-        similarity scoring to select the best match.
+        Uses context disambiguation when context is given and the snippet
+        occurs more than once; otherwise takes the first sequential match.
 
         Args:
-            page_number: Page number to insert
+            page_number: Page number (for progress messages)
             snippet: Text snippet that marks the insertion point
             context_before: Optional context words before snippet (from PDF)
             context_after: Optional context words after snippet (from PDF)
-            occurrence: Which occurrence of this page number (1 = first, 2 = second, etc.)
-                        Used for two-column layouts where same page appears twice.
 
         Returns:
-            True if successful, False otherwise
+            Tuple of (text_node, position_in_node, container_index, marker_position)
+            or (None, None, -1, 0) if not found
         """
         # Determine snippet length for context scoring
-        if "|" in snippet:
-            parts = snippet.split("|", 1)
-            snippet_before = parts[0].strip()
-            snippet_after = parts[1].strip() if len(parts) > 1 else ""
-            search_snippet = f"{snippet_before} {snippet_after}".strip()
-        else:
-            search_snippet = snippet
-
+        search_snippet, marker_offset = self._parse_snippet(snippet)
         snippet_len = len(search_snippet)
 
         # Check if we have context for disambiguation
@@ -500,10 +781,7 @@ class PageMarkerInserter:
                     # marker_position is where the marker goes:
                     # - Without |: after the full search_snippet
                     # - With |: after snippet_before (the | marker point)
-                    if "|" in snippet:
-                        actual_snippet_start = marker_position - len(snippet_before)
-                    else:
-                        actual_snippet_start = marker_position - len(search_snippet)
+                    actual_snippet_start = marker_position - marker_offset
 
                     score = self._score_context_match(
                         container_text, actual_snippet_start, snippet_len,
@@ -513,18 +791,22 @@ class PageMarkerInserter:
                     if score > best_score:
                         best_score = score
                         best_location = loc
+                        # Later candidates only win on a strictly higher score,
+                        # so nothing can replace a perfect context match
+                        if best_score >= 1.0:
+                            break
 
                 # Use context match if score >= 0.3 (empirically chosen threshold requiring
                 # at least ~1/3 word overlap to avoid false positives from unrelated context)
                 if best_score >= 0.3 and best_location is not None:
                     text_node, position_in_node, container_idx, container_pos, _ = best_location
                     self.stats["context_used"] = self.stats.get("context_used", 0) + 1
-                    print(f"  ℹ Page {page_number}: Context disambiguation used (score: {best_score:.2f})")
+                    self._emit(f"  ℹ Page {page_number}: Context disambiguation used (score: {best_score:.2f})")
                 else:
                     # Fall back to first sequential match - warn user as placement may be wrong
                     text_node, position_in_node, container_idx, container_pos, _ = all_locations[0]
                     self.stats["context_fallback"] = self.stats.get("context_fallback", 0) + 1
-                    print(f"  ⚠ Page {page_number}: Context score too low ({best_score:.2f}), using first sequential match - verify placement")
+                    self._emit(f"  ⚠ Page {page_number}: Context score too low ({best_score:.2f}), using first sequential match - verify placement")
             elif len(all_locations) == 1:
                 # Single match - use it directly
                 text_node, position_in_node, container_idx, container_pos, _ = all_locations[0]
@@ -536,14 +818,96 @@ class PageMarkerInserter:
                 snippet, self._last_insertion_container_idx, self._last_insertion_position
             )
 
+        return (text_node, position_in_node, container_idx, container_pos)
+
+    def insert_page_marker(
+        self,
+        page_number: Union[str, int],
+        snippet: str,
+        context_before: Optional[str] = None,
+        context_after: Optional[str] = None,
+        occurrence: int = 1,
+    ) -> bool:
+        """Insert a page marker after the specified snippet.
+
+        Uses sequential position tracking: each marker is only placed AFTER
+        the previous marker's position in the document. This ensures correct
+        ordering even when snippet text appears multiple times, including
+        multiple page breaks within the same paragraph.
+
+        When context is provided and multiple matches exist, uses Jaccard
+        similarity scoring to select the best match.
+
+        Args:
+            page_number: Page number to insert
+            snippet: Text snippet that marks the insertion point
+            context_before: Optional context words before snippet (from PDF)
+            context_after: Optional context words after snippet (from PDF)
+            occurrence: Which occurrence of this page number (1 = first, 2 = second, etc.)
+                        Used for two-column layouts where same page appears twice.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Unfilled template entries can never match: record them without searching
+        if snippet.startswith(PLACEHOLDER_PREFIX):
+            self._emit(f"  ✗ Page {page_number}: Placeholder snippet was never filled in")
+            self.stats["not_found"] += 1
+            self.failed_pages.append({
+                "page": page_number,
+                "snippet": snippet,
+                "last_container": self._last_insertion_container_idx,
+                "last_position": self._last_insertion_position,
+                "placeholder": True,
+            })
+            return False
+
+        text_node, position_in_node, container_idx, container_pos = self._locate_marker(
+            page_number, snippet, context_before, context_after
+        )
+
+        # PDF text and HTML may encode accents differently (precomposed vs
+        # combining marks): retry with the other Unicode normalization forms
+        if text_node is None and not snippet.isascii():
+            for form in ("NFC", "NFD"):
+                variant = unicodedata.normalize(form, snippet)
+                if variant == snippet:
+                    continue
+                text_node, position_in_node, container_idx, container_pos = self._locate_marker(
+                    page_number, variant, context_before, context_after
+                )
+                if text_node is not None:
+                    self.stats["unicode_normalized"] = self.stats.get("unicode_normalized", 0) + 1
+                    self._emit(f"  ℹ Page {page_number}: Matched after {form} normalization")
+                    break
+
+        # PDF text often breaks lines or doubles spaces where the HTML doesn't
+        if text_node is None:
+            text_node, position_in_node, container_idx, container_pos = (
+                self.find_snippet_location_loose(
+                    snippet, self._last_insertion_container_idx, self._last_insertion_position
+                )
+            )
+            if text_node is not None:
+                self.stats["whitespace_normalized"] = self.stats.get("whitespace_normalized", 0) + 1
+                self._emit(f"  ℹ Page {page_number}: Matched after collapsing whitespace")
+
         if text_node is None or position_in_node is None:
-            print(f"  ✗ Page {page_number}: Snippet not found after container {self._last_insertion_container_idx}:{self._last_insertion_position}")
+            # One full rescan to tell "missing" apart from "out of order"
+            earlier_idx = -1
+            if self._last_insertion_container_idx >= 0:
+                _, _, earlier_idx, _ = self.find_snippet_location(snippet)
+
+            self._emit(f"  ✗ Page {page_number}: Snippet not found after container {self._last_insertion_container_idx}:{self._last_insertion_position}")
+            if earlier_idx >= 0:
+                self._emit(f"    ⚠ Snippet exists earlier (container {earlier_idx}) - likely out of order")
             self.stats["not_found"] += 1
             self.failed_pages.append({
                 "page": page_number,
                 "snippet": snippet,
                 "last_container": self._last_insertion_container_idx,
                 "last_position": self._last_insertion_position,
+                "earlier_container": earlier_idx,
             })
             return False
 
@@ -551,10 +915,9 @@ class PageMarkerInserter:
         marker = self.create_page_marker(page_number, occurrence)
 
         # Split the text node at the position where snippet ends
-        text_content = str(text_node)
-
-        before_text = text_content[:position_in_node]
-        after_text = text_content[position_in_node:]
+        # (NavigableString is a str subclass, so slice it directly)
+        before_text = text_node[:position_in_node]
+        after_text = text_node[position_in_node:]
 
         # Create new text nodes with spacing around marker for readability
         # Only add space if not already present to avoid double spaces
@@ -563,17 +926,32 @@ class PageMarkerInserter:
         before_node = NavigableString(before_with_space)
         after_node = NavigableString(after_with_space) if after_text else None
 
-        # Insert in order: before, marker, after
-        text_node.replace_with(before_node)
-        before_node.insert_after(marker)
+        # Splice before, marker, after into the text node's place in one mutation
         if after_node:
-            marker.insert_after(after_node)
+            text_node.replace_with(before_node, marker, after_node)
+        else:
+            text_node.replace_with(before_node, marker)
+
+        # Sequential placement keeps this list in document order
+        try:
+            page_num: Optional[int] = int(page_number)
+        except ValueError:
+            page_num = None
+        self._inserted_markers.append((page_num, marker))
+
+        # Later searches must see the marker text in this container
+        new_nodes = [before_node]
+        if isinstance(marker.string, NavigableString):
+            new_nodes.append(marker.string)
+        if after_node:
+            new_nodes.append(after_node)
+        self._splice_container_entry(container_idx, container_pos, text_node, new_nodes)
 
         # Update position tracking for next insertion
         self._last_insertion_container_idx = container_idx
         self._last_insertion_position = container_pos
 
-        print(f"  ✓ Page {page_number}: Marker inserted (container {container_idx}:{container_pos})")
+        self._emit(f"  ✓ Page {page_number}: Marker inserted (container {container_idx}:{container_pos})")
         self.stats["found"] += 1
         return True
 
@@ -593,38 +971,41 @@ class PageMarkerInserter:
         self._last_insertion_container_idx = -1
         self._last_insertion_position = 0
         self._containers = None  # Re-cache containers
+        self._container_index = None
+        self._inserted_markers = []
 
         # Sort by page number to process in order
-        sorted_refs = sorted(
-            self.page_references,
-            key=lambda x: (
-                # Handle both numeric and roman numeral pages
-                int(x.get("page", 0)) if str(x.get("page", "")).isdigit() else 0,
-                str(x.get("page", ""))
-            )
-        )
+        sorted_refs = sorted(self.page_references, key=_page_sort_key)
 
         # Track page occurrences for duplicate IDs (two-column layouts)
         page_occurrences: Dict[Union[str, int], int] = defaultdict(int)
 
-        for entry in sorted_refs:
-            page = entry.get("page")
-            snippet = entry.get("snippet")
+        # Buffer per-page lines and write them in one call at the end, or
+        # in batches on a terminal so progress stays visible
+        self._log = []
+        self._log_flush_every = TTY_FLUSH_LINES if sys.stdout.isatty() else None
+        try:
+            for entry in sorted_refs:
+                page = entry.get("page")
+                snippet = entry.get("snippet")
 
-            if page is None or snippet is None:
-                print(f"  ✗ Invalid entry (missing page or snippet): {entry}")
-                self.stats["not_found"] += 1
-                continue
+                if page is None or snippet is None:
+                    self._emit(f"  ✗ Invalid entry (missing page or snippet): {entry}")
+                    self.stats["not_found"] += 1
+                    continue
 
-            # Track occurrence for unique ID generation
-            page_occurrences[page] += 1
-            occurrence = page_occurrences[page]
+                # Track occurrence for unique ID generation
+                page_occurrences[page] += 1
+                occurrence = page_occurrences[page]
 
-            # Extract context for disambiguation (if present in JSON)
-            context_before = entry.get("context_before")
-            context_after = entry.get("context_after")
+                # Extract context for disambiguation (if present in JSON)
+                context_before = entry.get("context_before")
+                context_after = entry.get("context_after")
 
-            self.insert_page_marker(page, snippet, context_before, context_after, occurrence)
+                self.insert_page_marker(page, snippet, context_before, context_after, occurrence)
+        finally:
+            self._flush_log()
+            self._log = None
 
     def _inject_page_number_css(self) -> None:
         """Inject CSS styling for page-number markers into the HTML head."""
@@ -655,6 +1036,8 @@ class PageMarkerInserter:
 
         Page markers should appear in ascending order throughout the document.
         Any marker that breaks this sequence is likely placed incorrectly.
+        Only markers inserted by this instance are checked; page-number
+        spans already present in the input HTML are left untouched.
 
         Returns:
             Number of markers removed
@@ -662,30 +1045,25 @@ class PageMarkerInserter:
         if self.soup is None:
             return 0
 
-        # Find all page markers in document order
-        markers = self.soup.find_all("span", class_="page-number")
-
-        # Extract page numbers and track which to remove
+        # Walk the markers inserted by this run instead of searching the tree
         to_remove = []
+        kept = []
         max_page_seen = -1
 
-        for marker in markers:
-            try:
-                page_num = int(marker.get_text())
-                if page_num < max_page_seen:
-                    # This marker is out of order - mark for removal
-                    to_remove.append(marker)
-                else:
-                    max_page_seen = page_num
-            except (ValueError, TypeError):
-                # Non-numeric page (e.g., roman numerals) - skip
+        for page_num, marker in self._inserted_markers:
+            if page_num is not None and page_num < max_page_seen:
+                # This marker is out of order - mark for removal
+                to_remove.append(marker)
                 continue
+            if page_num is not None:
+                max_page_seen = page_num
+            # Non-numeric pages (e.g., roman numerals) are never removed
+            kept.append((page_num, marker))
 
         # Remove out-of-order markers
         for marker in to_remove:
-            page_num = marker.get_text()
-            # Replace marker with empty string (remove it)
             marker.decompose()
+        self._inserted_markers = kept
 
         if to_remove:
             print(f"\n⚠ Removed {len(to_remove)} out-of-order markers")
@@ -709,9 +1087,10 @@ class PageMarkerInserter:
             self._inject_page_number_css()
 
         try:
-            with open(self.output_path, "w", encoding="utf-8") as f:
-                # Use formatter="minimal" to preserve original whitespace and attributes
-                f.write(self.soup.decode(formatter="minimal"))
+            # Encode straight to UTF-8 bytes; formatter="minimal" preserves
+            # original whitespace and attributes while still escaping &, < and >
+            with open(self.output_path, "wb") as f:
+                f.write(self.soup.encode("utf-8", formatter="minimal"))
             print(f"\n✓ Saved output to {self.output_path}")
         except Exception as e:
             print(f"\n✗ Error saving output: {e}")
@@ -736,6 +1115,12 @@ class PageMarkerInserter:
         context_fallback = self.stats.get("context_fallback", 0)
         if context_fallback > 0:
             print(f"Context fallbacks:   {context_fallback} ⚠ (verify these placements)")
+        unicode_normalized = self.stats.get("unicode_normalized", 0)
+        if unicode_normalized > 0:
+            print(f"Unicode-normalized matches: {unicode_normalized}")
+        whitespace_normalized = self.stats.get("whitespace_normalized", 0)
+        if whitespace_normalized > 0:
+            print(f"Whitespace-normalized matches: {whitespace_normalized}")
         if out_of_order > 0:
             print(f"Out-of-order removed: {out_of_order}")
             print(f"Final markers kept:  {kept}")
@@ -743,8 +1128,8 @@ class PageMarkerInserter:
         if self.stats["not_found"] > 0:
             print("\n⚠ Some page markers could not be inserted.")
             print("  Common issues:")
-            print("  • Snippets must match EXACTLY (including whitespace)")
-            print("  • Check for typos or extra spaces")
+            print("  • Snippets must match EXACTLY (only whitespace runs may differ)")
+            print("  • Check for typos or missing spaces")
             print("  • Snippet may exist in a skipped element (script, style, head)")
             print("  • Try a slightly different snippet from nearby text")
             self._print_failed_report()
@@ -766,16 +1151,24 @@ class PageMarkerInserter:
             snippet = failure["snippet"]
             last_container = failure["last_container"]
             last_position = failure["last_position"]
+            earlier_container = failure.get("earlier_container", -1)
 
             # Truncate snippet for display
             display_snippet = snippet[:60] + "..." if len(snippet) > 60 else snippet
 
             print(f"\nPage {page}:")
             print(f"  Snippet: \"{display_snippet}\"")
+            if failure.get("placeholder"):
+                print("  Cause: Placeholder was never replaced with text from the PDF")
+                continue
             print(f"  Searched after: container {last_container}, position {last_position}")
-            print(f"  Possible causes:")
-            print(f"    - Snippet text doesn't exist in HTML")
-            print(f"    - Snippet exists only before position {last_position} (duplicate text)")
+            if earlier_container >= 0:
+                print(f"  Cause: Snippet only exists before the previous marker (container {earlier_container})")
+                print("    - Check page order, or the previous page's snippet may have matched too late")
+            else:
+                print(f"  Possible causes:")
+                print(f"    - Snippet text doesn't exist in HTML")
+                print(f"    - Snippet exists only before position {last_position} (duplicate text)")
 
     def run(self) -> None:
         """Execute the full page marker insertion process."""
@@ -1,10 +1,23 @@
 """PDF text extraction for automatic snippet generation."""
 
+import html
 import json
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from heapq import nlargest
+from importlib import import_module
+from importlib.util import find_spec
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
-
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union
+
+from .exceptions import (
+    InvalidParameterError,
+    MissingDependencyError,
+    PDFExtractionError,
+    PDFNotFoundError,
+)
 from .word_segmentation import segment_snippet
 
 # Common patterns for production metadata to exclude from snippets
@@ -16,49 +29,60 @@ DEFAULT_EXCLUDE_PATTERNS = [
     r"\d{1,2}/\d{1,2}/\d{2,4}\s+\d{1,2}:\d{2}\s*(AM|PM)?",
 ]
 
+# Fraction of the page height read first by the pdfplumber bottom_visual strategy
+BOTTOM_BAND_RATIO = 0.25
+
 if TYPE_CHECKING:
     import fitz
     import pdfplumber.page
     from .html_matcher import HTMLMatcher
 
-try:
-    import fitz  # PyMuPDF
-
-    HAS_PYMUPDF = True
-except ImportError:
-    HAS_PYMUPDF = False
-
-try:
-    import pdfplumber
+# The PDF backends are large, so they are only looked up here and imported
+# when a PDFExtractor picks one; validate_snippets and friends run without
+# loading either. find_spec can't tell a broken install from a working one,
+# so PDFExtractor also checks that the import succeeds (_backend_available).
+HAS_PYMUPDF = find_spec("fitz") is not None  # PyMuPDF
+HAS_PDFPLUMBER = find_spec("pdfplumber") is not None
 
-    HAS_PDFPLUMBER = True
-except ImportError:
-    HAS_PDFPLUMBER = False
+_PDF_BACKENDS = ("fitz", "pdfplumber")
 
 
-# Custom exceptions
-class PDFExtractionError(Exception):
-    """Base exception for PDF extraction errors."""
+def _backend(name: str) -> Any:
+    """Return a PDF backend module, importing it into this module on first use."""
+    module = globals().get(name)
+    if module is None:
+        module = globals()[name] = import_module(name)
+    return module
 
-    pass
 
+def _backend_available(name: str) -> bool:
+    """Import a PDF backend, reporting False if the installed package is broken."""
+    try:
+        _backend(name)
+    except ImportError:
+        return False
+    return True
 
-class MissingDependencyError(PDFExtractionError):
-    """Raised when required PDF library is not installed."""
-
-    pass
 
+def __getattr__(name: str) -> Any:
+    if name in _PDF_BACKENDS:
+        return _backend(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-class PDFNotFoundError(PDFExtractionError):
-    """Raised when PDF file is not found."""
 
-    pass
+try:
+    import orjson
 
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-class InvalidParameterError(PDFExtractionError):
-    """Raised when invalid parameters are provided."""
+try:
+    import ahocorasick
 
-    pass
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 
 class PDFExtractor:
@@ -85,6 +109,10 @@ class PDFExtractor:
         complete_words_html_path: Optional[Union[str, Path]] = None,
         context_words: int = 4,
         two_column: bool = False,
+        html_cache_dir: Optional[Union[str, Path]] = None,
+        match_workers: int = 1,
+        page_workers: int = 1,
+        verbose: bool = True,
     ) -> None:
         """Initialize PDF extractor.
 
@@ -113,6 +141,13 @@ class PDFExtractor:
             two_column: Enable two-column layout extraction. When True, extracts text only
                 from the body columns area (top ~75% of page), skipping the footnote zone
                 at the bottom. Text is extracted from the end of the rightmost column.
+            html_cache_dir: Optional directory for caching the fuzzy matcher's
+                extracted HTML text between runs
+            match_workers: Number of processes for fuzzy HTML matching
+                (default: 1, matches serially)
+            page_workers: Number of processes for PyMuPDF page text extraction
+                (default: 1, extracts serially)
+            verbose: Write page progress to stderr every 50 pages
 
         Raises:
             InvalidParameterError: If snippet_words or min_words are invalid
@@ -141,6 +176,9 @@ class PDFExtractor:
         self.min_font_size = min_font_size
         self.context_words = context_words
         self.two_column = two_column
+        self.match_workers = match_workers
+        self.page_workers = page_workers
+        self.verbose = verbose
 
         # Build list of exclude patterns
         self.exclude_patterns: List[re.Pattern[str]] = []
@@ -184,7 +222,7 @@ class PDFExtractor:
             try:
                 from .html_matcher import HTMLMatcher
 
-                self.html_matcher = HTMLMatcher(self.match_html_path)
+                self.html_matcher = HTMLMatcher(self.match_html_path, cache_dir=html_cache_dir)
                 print("Enabled fuzzy HTML matching (this may be slow for large files)")
             except ImportError as e:
                 raise MissingDependencyError(
@@ -193,20 +231,22 @@ class PDFExtractor:
 
         # Select backend
         if backend == "auto":
-            if HAS_PYMUPDF:
+            if HAS_PYMUPDF and _backend_available("fitz"):
                 self.backend = "pymupdf"
-            elif HAS_PDFPLUMBER:
+            elif HAS_PDFPLUMBER and _backend_available("pdfplumber"):
                 self.backend = "pdfplumber"
             else:
                 raise MissingDependencyError(
                     "Neither PyMuPDF nor pdfplumber is installed. "
                     "Install with: pip install PyMuPDF pdfplumber"
                 )
-        elif backend == "pymupdf" and not HAS_PYMUPDF:
+        elif backend == "pymupdf" and not (HAS_PYMUPDF and _backend_available("fitz")):
             raise MissingDependencyError(
                 "PyMuPDF not installed. Install with: pip install PyMuPDF"
             )
-        elif backend == "pdfplumber" and not HAS_PDFPLUMBER:
+        elif backend == "pdfplumber" and not (
+            HAS_PDFPLUMBER and _backend_available("pdfplumber")
+        ):
             raise MissingDependencyError(
                 "pdfplumber not installed. Install with: pip install pdfplumber"
             )
@@ -703,9 +743,31 @@ class PDFExtractor:
 
         return text
 
-    def extract_with_pymupdf(self) -> List[Dict[str, Any]]:
+    def _page_range(
+        self, page_count: int, start_page: int = 1, end_page: Optional[int] = None
+    ) -> range:
+        """Return the 0-based page indices to extract.
+
+        Args:
+            page_count: Number of pages in the document
+            start_page: First page number to extract (1-based)
+            end_page: Last page number to extract (None for the last page)
+
+        Returns:
+            Range of page indices, empty if the requested range is outside the document
+        """
+        last = page_count if end_page is None else min(end_page, page_count)
+        return range(max(start_page, 1) - 1, max(last, 0))
+
+    def extract_with_pymupdf(
+        self, start_page: int = 1, end_page: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Extract snippets using PyMuPDF (fast, good layout analysis).
 
+        Args:
+            start_page: First page number to extract (1-based)
+            end_page: Last page number to extract (None for the last page)
+
         Returns:
             List of dictionaries with 'page' and 'snippet' keys
 
@@ -715,33 +777,25 @@ class PDFExtractor:
         snippets = []
 
         try:
-            with fitz.open(str(self.pdf_path)) as doc:
-                self.stats["total_pages"] = len(doc)
-
-                print(f"Using PyMuPDF backend for {len(doc)} pages...")
-
-                # First pass: extract all page texts
-                page_texts = []
-                for page_num in range(len(doc)):
-                    page = doc[page_num]
-                    if self.two_column:
-                        # Two-column layout: extract from body columns only, skip footnote zone
-                        text = self._extract_two_column_body_pymupdf(page)
-                    elif self.skip_footnotes:
-                        text = self._extract_body_text_pymupdf(page)
-                    else:
-                        text = page.get_text()
-                    text = self._filter_production_metadata(text)
-                    text = self._dehyphenate(text)
-                    page_texts.append(text)
+            with _backend("fitz").open(str(self.pdf_path)) as doc:
+                pages = self._page_range(len(doc), start_page, end_page)
+                self.stats["total_pages"] = len(pages)
+
+                print(f"Using PyMuPDF backend for {len(pages)} pages...")
+
+                # First pass: extract page texts for the requested range only
+                if self.page_workers > 1 and len(pages) > 1:
+                    page_texts = self._page_texts_parallel_pymupdf(pages)
+                else:
+                    page_texts = [self._page_text_pymupdf(doc[i]) for i in pages]
 
                 # Second pass: extract snippets with context from next page
-                for page_num in range(len(doc)):
-                    if (page_num + 1) % 50 == 0:
-                        print(f"  Processing page {page_num + 1}/{len(doc)}...")
+                for i, page_num in enumerate(pages):
+                    if self.verbose and (page_num + 1) % 50 == 0:
+                        sys.stderr.write(f"  Processing page {page_num + 1}/{len(doc)}...\n")
 
-                    current_text = page_texts[page_num]
-                    next_text = page_texts[page_num + 1] if page_num + 1 < len(doc) else ""
+                    current_text = page_texts[i]
+                    next_text = page_texts[i + 1] if i + 1 < len(pages) else ""
 
                     snippet = self._extract_snippet_with_context(
                         current_text, next_text, page_num + 1
@@ -753,6 +807,76 @@ class PDFExtractor:
 
         return snippets
 
+    def _page_text_pymupdf(self, page: "fitz.Page") -> str:
+        """Extract one page's cleaned text for snippet selection.
+
+        Args:
+            page: PyMuPDF page object
+
+        Returns:
+            Page text with production metadata removed and hyphenation rejoined
+        """
+        if self.two_column:
+            # Two-column layout: extract from body columns only, skip footnote zone
+            text = self._extract_two_column_body_pymupdf(page)
+        elif self.skip_footnotes:
+            text = self._extract_body_text_pymupdf(page)
+        else:
+            text = page.get_text()
+        text = self._filter_production_metadata(text)
+        return self._dehyphenate(text)
+
+    def _page_texts_parallel_pymupdf(self, pages: range) -> List[str]:
+        """Extract page texts across page_workers processes.
+
+        Each worker opens the PDF once and handles one contiguous run of
+        pages; results come back in page order.
+
+        Args:
+            pages: 0-based page indices to extract
+
+        Returns:
+            Cleaned page texts, one per page index
+        """
+        workers = min(self.page_workers, len(pages))
+        size = -(-len(pages) // workers)  # ceiling division
+        chunks = [pages[i:i + size] for i in range(0, len(pages), size)]
+        options = {
+            "two_column": self.two_column,
+            "skip_footnotes": self.skip_footnotes,
+            "min_font_size": self.min_font_size,
+            "exclude_patterns": [p.pattern for p in self.exclude_patterns],
+        }
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_page_text_worker,
+            initargs=(self.pdf_path, options),
+        ) as executor:
+            return [text for texts in executor.map(_page_texts_in_worker, chunks) for text in texts]
+
+    def _select_words(self, text: str) -> Tuple[List[str], int]:
+        """Split off only the snippet words at the strategy's end of the text.
+
+        Splits at most max(snippet_words, min_words) words instead of the
+        whole page, so the word count is exact whenever it matters for the
+        min_words check.
+
+        Args:
+            text: Cleaned page text
+
+        Returns:
+            Tuple of (snippet_words, word_count); word_count is exact up to
+            max(snippet_words, min_words) and a lower bound above that
+        """
+        limit = max(self.snippet_words, self.min_words)
+        if self.strategy == "beginning_of_page":
+            parts = text.split(None, limit)
+            return parts[:self.snippet_words], len(parts)
+        # end_of_page (default) and bottom_visual
+        parts = text.rsplit(None, limit)
+        return parts[-self.snippet_words:], len(parts)
+
     def _extract_snippet_with_context(
         self, current_text: str, next_text: str, page_num: int
     ) -> Dict[str, Any]:
@@ -766,9 +890,9 @@ class PDFExtractor:
         Returns:
             Dictionary with page number, snippet, and optional context_before/context_after
         """
-        current_words = current_text.split()
+        current_words, word_count = self._select_words(current_text)
 
-        if len(current_words) < self.min_words:
+        if word_count < self.min_words:
             self.stats["insufficient_text"] += 1
             placeholder = (
                 "PASTE_TEXT_FROM_BEGINNING_OF_PAGE_HERE"
@@ -778,15 +902,10 @@ class PDFExtractor:
             return {
                 "page": page_num,
                 "snippet": placeholder,
-                "note": f"Insufficient text (found {len(current_words)} words)",
+                "note": f"Insufficient text (found {word_count} words)",
             }
 
-        # Get words based on strategy
-        if self.strategy == "beginning_of_page":
-            snippet = " ".join(current_words[:self.snippet_words])
-        else:
-            # end_of_page (default) and bottom_visual
-            snippet = " ".join(current_words[-self.snippet_words:])
+        snippet = " ".join(current_words)
 
         # Store original snippet before cleaning for context extraction
         original_snippet = snippet
@@ -835,21 +954,22 @@ class PDFExtractor:
     def _extract_page_snippet_pymupdf(
         self, page: "fitz.Page", page_num: int
     ) -> Dict[str, Any]:
-        """Extract snippet from a single page using PyMuPDF."""
+        """Extract snippet from a single page using PyMuPDF.
+
+        Not used by extract_with_pymupdf, which reads pages through
+        _page_text_pymupdf and so has no bottom_visual handling.
+        """
         try:
             if self.skip_footnotes:
                 # Extract text while filtering by font size to skip footnotes
                 text = self._extract_body_text_pymupdf(page)
             elif self.strategy == "bottom_visual":
                 # Get text blocks with positions
-                blocks = page.get_text("blocks")
-
-                # Sort by Y coordinate descending (bottom first)
                 # Block format: (x0, y0, x1, y1, "text", block_no, block_type)
-                blocks.sort(key=lambda b: -b[1])
+                blocks = page.get_text("blocks")
 
-                # Get text from bottommost block
-                text = blocks[0][4] if blocks else ""
+                # Text from the bottommost block (largest y0) in one pass
+                text = max(blocks, key=itemgetter(1))[4] if blocks else ""
             else:  # end_of_page
                 # Get all text
                 text = page.get_text()
@@ -926,9 +1046,15 @@ class PDFExtractor:
                 "note": f"Extraction failed: {str(e)}",
             }
 
-    def extract_with_pdfplumber(self) -> List[Dict[str, Any]]:
+    def extract_with_pdfplumber(
+        self, start_page: int = 1, end_page: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Extract snippets using pdfplumber (better for complex layouts).
 
+        Args:
+            start_page: First page number to extract (1-based)
+            end_page: Last page number to extract (None for the last page)
+
         Returns:
             List of dictionaries with 'page' and 'snippet' keys
 
@@ -938,23 +1064,54 @@ class PDFExtractor:
         snippets = []
 
         try:
-            with pdfplumber.open(str(self.pdf_path)) as pdf:
-                self.stats["total_pages"] = len(pdf.pages)
-                print(f"Using pdfplumber backend for {len(pdf.pages)} pages...")
+            with _backend("pdfplumber").open(str(self.pdf_path)) as pdf:
+                pages = self._page_range(len(pdf.pages), start_page, end_page)
+                self.stats["total_pages"] = len(pages)
+                print(f"Using pdfplumber backend for {len(pages)} pages...")
 
-                for page_num, page in enumerate(pdf.pages, 1):
+                for index in pages:
+                    page_num = index + 1
                     # Show progress for large files
-                    if page_num % 50 == 0:
-                        print(f"  Processing page {page_num}/{len(pdf.pages)}...")
+                    if self.verbose and page_num % 50 == 0:
+                        sys.stderr.write(f"  Processing page {page_num}/{len(pdf.pages)}...\n")
 
-                    snippet = self._extract_page_snippet_pdfplumber(page, page_num)
+                    snippet = self._extract_page_snippet_pdfplumber(pdf.pages[index], page_num)
                     snippets.append(snippet)
 
         except Exception as e:
             raise PDFExtractionError(f"Error reading PDF with pdfplumber: {e}") from e
 
+        # Second pass: fuzzy-match all pending snippets against the HTML
+        if self.html_matcher:
+            self._apply_html_matches(snippets)
+
         return snippets
 
+    def _apply_html_matches(self, snippets: List[Dict[str, Any]]) -> None:
+        """Replace snippets marked for HTML matching with their matched text.
+
+        All pending snippets are matched in one batch so the work can be
+        spread over match_workers processes.
+        """
+        pending = [i for i, s in enumerate(snippets) if s.get("method") == "html_match"]
+        if not pending or self.html_matcher is None:
+            return
+
+        print(f"Matching {len(pending)} snippets against HTML...")
+        try:
+            results = self.html_matcher.find_match_batch(
+                [snippets[i]["snippet"] for i in pending], workers=self.match_workers
+            )
+        except Exception as e:
+            raise PDFExtractionError(f"Error matching snippets against HTML: {e}") from e
+        for i, result in zip(pending, results):
+            snippets[i] = {
+                "page": snippets[i]["page"],
+                "snippet": result["matched_text"].strip(),
+                "confidence": round(result["confidence"], 2),
+                "method": "html_match",
+            }
+
     def _extract_two_column_body_pdfplumber(
         self, page: "pdfplumber.page.Page", footnote_zone_ratio: float = 0.25
     ) -> str:
@@ -1002,6 +1159,31 @@ class PDFExtractor:
 
         return text
 
+    def _bottom_words_pdfplumber(self, page: "pdfplumber.page.Page") -> List[Dict[str, Any]]:
+        """Extract words for the bottom_visual strategy, reading as little as possible.
+
+        Word extraction cost grows with the characters analyzed, so only the
+        bottom BOTTOM_BAND_RATIO of the page is read first. Words starting
+        inside that band are exactly the page's bottommost words, so the
+        band is used when it holds at least snippet_words of them; otherwise
+        the whole page is read.
+
+        Args:
+            page: pdfplumber page object
+
+        Returns:
+            Word dictionaries as returned by extract_words()
+        """
+        x0, top, x1, bottom = page.bbox
+        band_top = bottom - (bottom - top) * BOTTOM_BAND_RATIO
+        words = [
+            w for w in page.crop((x0, band_top, x1, bottom)).extract_words()
+            if w["top"] >= band_top
+        ]
+        if len(words) >= self.snippet_words:
+            return words
+        return page.extract_words()
+
     def _extract_page_snippet_pdfplumber(
         self, page: "pdfplumber.page.Page", page_num: int
     ) -> Dict[str, Any]:
@@ -1011,20 +1193,17 @@ class PDFExtractor:
                 # Two-column layout: extract from body columns only
                 text = self._extract_two_column_body_pdfplumber(page)
             elif self.strategy == "bottom_visual":
-                # Get words with bounding boxes
-                words = page.extract_words()
+                # Get words with bounding boxes, from the bottom band first
+                words = self._bottom_words_pdfplumber(page)
 
                 if not words:
                     text = ""
                 else:
-                    # Sort by vertical position (bottom first)
-                    words_sorted = sorted(words, key=lambda w: -w["top"])
-
-                    # Get bottom N words
-                    bottom_words = words_sorted[: self.snippet_words]
+                    # Get bottom N words by vertical position
+                    bottom_words = nlargest(self.snippet_words, words, key=itemgetter("top"))
 
                     # Re-sort by reading order (top to bottom, left to right)
-                    bottom_words.sort(key=lambda w: (w["top"], w["x0"]))
+                    bottom_words.sort(key=itemgetter("top", "x0"))
 
                     text = " ".join(w["text"] for w in bottom_words)
             else:  # end_of_page or beginning_of_page
@@ -1037,9 +1216,9 @@ class PDFExtractor:
             text = self._dehyphenate(text)
 
             # Extract snippet
-            words = text.split()
+            words, word_count = self._select_words(text)
 
-            if len(words) < self.min_words:
+            if word_count < self.min_words:
                 self.stats["insufficient_text"] += 1
                 placeholder = (
                     "PASTE_TEXT_FROM_BEGINNING_OF_PAGE_HERE"
@@ -1049,14 +1228,10 @@ class PDFExtractor:
                 return {
                     "page": page_num,
                     "snippet": placeholder,
-                    "note": f"Insufficient text (found {len(words)} words, need {self.min_words})",
+                    "note": f"Insufficient text (found {word_count} words, need {self.min_words})",
                 }
 
-            # Select words based on strategy
-            if self.strategy == "beginning_of_page":
-                snippet = " ".join(words[:self.snippet_words])
-            else:
-                snippet = " ".join(words[-self.snippet_words:])
+            snippet = " ".join(words)
 
             # Trim to natural boundary and clean based on strategy
             if self.strategy == "beginning_of_page":
@@ -1066,14 +1241,13 @@ class PDFExtractor:
                 snippet = self._trim_to_boundary(snippet)
                 snippet = self._clean_snippet(snippet, self.html_text)
 
-            # Apply HTML matching if available (highest priority)
+            # HTML matching has highest priority; it runs as a batch after
+            # all pages are read (see _apply_html_matches)
             if self.html_matcher:
-                result = self.html_matcher.find_match(snippet)
                 self.stats["successful"] += 1
                 return {
                     "page": page_num,
-                    "snippet": result["matched_text"].strip(),
-                    "confidence": round(result["confidence"], 2),
+                    "snippet": snippet,
                     "method": "html_match",
                 }
 
@@ -1113,9 +1287,17 @@ class PDFExtractor:
                 "note": f"Extraction failed: {str(e)}",
             }
 
-    def extract(self) -> List[Dict[str, Any]]:
+    def extract(
+        self, start_page: int = 1, end_page: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """Extract snippets using the configured backend.
 
+        Pages outside start_page..end_page are never read.
+
+        Args:
+            start_page: First page number to extract (1-based)
+            end_page: Last page number to extract (None for the last page)
+
         Returns:
             List of dictionaries with 'page' and 'snippet' keys
 
@@ -1135,9 +1317,9 @@ class PDFExtractor:
         print()
 
         if self.backend == "pymupdf":
-            return self.extract_with_pymupdf()
+            return self.extract_with_pymupdf(start_page, end_page)
         else:
-            return self.extract_with_pdfplumber()
+            return self.extract_with_pdfplumber(start_page, end_page)
 
     def save_to_json(
         self, output_path: Union[str, Path], snippets: List[Dict[str, Any]]
@@ -1154,8 +1336,14 @@ class PDFExtractor:
         output_path = Path(output_path)
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(snippets, f, indent=2, ensure_ascii=False)
+            if HAS_ORJSON:
+                # Same layout as json.dump(indent=2, ensure_ascii=False), encoded in C
+                output_path.write_bytes(orjson.dumps(snippets, option=orjson.OPT_INDENT_2))
+            else:
+                # One write instead of json.dump's write per encoded chunk
+                output_path.write_text(
+                    json.dumps(snippets, indent=2, ensure_ascii=False), encoding="utf-8"
+                )
             print(f"\n✓ Saved {len(snippets)} snippets to {output_path}")
         except Exception as e:
             raise PDFExtractionError(f"Error saving JSON: {e}") from e
@@ -1186,6 +1374,66 @@ class PDFExtractor:
             print("  in the generated JSON file.")
 
 
+# Per-process extractor and open document used by page text workers
+_worker_extractor: Optional[PDFExtractor] = None
+_worker_doc: Any = None
+
+
+def _init_page_text_worker(pdf_path: Path, options: Dict[str, Any]) -> None:
+    """Open the PDF once and build a text-only extractor for this worker."""
+    global _worker_extractor, _worker_doc
+    _worker_extractor = PDFExtractor(
+        pdf_path, backend="pymupdf", use_default_excludes=False, **options
+    )
+    _worker_doc = _backend("fitz").open(str(pdf_path))
+
+
+def _page_texts_in_worker(page_indices: range) -> List[str]:
+    """Extract cleaned text for a run of pages in a worker process."""
+    assert _worker_extractor is not None, "worker initializer did not run"
+    return [_worker_extractor._page_text_pymupdf(_worker_doc[i]) for i in page_indices]
+
+
+def _normalize_validation_text(text: str) -> str:
+    """Collapse whitespace and spacing around slashes, as snippet cleaning does.
+
+    Args:
+        text: Snippet or HTML text
+
+    Returns:
+        Normalized text
+    """
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\s+/\s*", "/", text)
+    return re.sub(r"\s*/\s+", "/", text)
+
+
+def _snippets_found_in(snippets: List[str], text: str) -> set:
+    """Return the snippets that occur in text.
+
+    With pyahocorasick installed, all snippets are matched in a single pass
+    over text instead of one substring scan per snippet.
+
+    Args:
+        snippets: Non-empty snippet strings
+        text: Text to search
+
+    Returns:
+        Set of the snippets found in text
+    """
+    if not HAS_AHOCORASICK:
+        return {snippet for snippet in snippets if snippet in text}
+    if not snippets:
+        # An automaton with no words cannot be searched
+        return set()
+
+    automaton = ahocorasick.Automaton()
+    for snippet in snippets:
+        automaton.add_word(snippet, snippet)
+    automaton.make_automaton()
+    return {snippet for _, snippet in automaton.iter(text)}
+
+
 def validate_snippets(
     json_path: Union[str, Path],
     html_path: Optional[Union[str, Path]] = None,
@@ -1207,16 +1455,15 @@ def validate_snippets(
     json_path = Path(json_path)
 
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            snippets = json.load(f)
+        raw = json_path.read_bytes()
+        snippets = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
     except Exception as e:
         raise PDFExtractionError(f"Error loading JSON: {e}") from e
 
     # Check for duplicates
     from collections import Counter
 
-    snippet_texts = [s["snippet"] for s in snippets if "snippet" in s]
-    snippet_counts = Counter(snippet_texts)
+    snippet_counts = Counter(s["snippet"] for s in snippets if "snippet" in s)
     duplicates = {text: count for text, count in snippet_counts.items() if count > 1}
 
     # Count placeholders
@@ -1238,7 +1485,7 @@ def validate_snippets(
 
     results = {
         "total_snippets": len(snippets),
-        "unique_snippets": len(set(snippet_texts)),
+        "unique_snippets": len(snippet_counts),
         "duplicate_snippets": duplicates,
         "placeholder_count": placeholders,
         "context_full": context_full,
@@ -1254,19 +1501,19 @@ def validate_snippets(
                 html_content = f.read()
 
             # Strip HTML tags for text comparison (snippets won't have tags)
-            text_content = re.sub(r"<[^>]+>", "", html_content)
-            # Normalize whitespace
-            text_content = re.sub(r"\s+", " ", text_content)
-            # Normalize spacing around slashes (same as snippet cleaning)
-            text_content = re.sub(r"\s+/\s*", "/", text_content)
-            text_content = re.sub(r"\s*/\s+", "/", text_content)
-
-            missing = []
-            for item in snippets:
-                snippet = item.get("snippet", "")
-                if snippet and snippet != "PASTE_TEXT_FROM_END_OF_PAGE_HERE":
-                    if snippet not in text_content:
-                        missing.append(item["page"])
+            text_content = _normalize_validation_text(
+                html.unescape(re.sub(r"<[^>]+>", "", html_content))
+            )
+
+            checked = [
+                item for item in snippets
+                if item.get("snippet") and item["snippet"] != "PASTE_TEXT_FROM_END_OF_PAGE_HERE"
+            ]
+            normalized = [_normalize_validation_text(item["snippet"]) for item in checked]
+            found = _snippets_found_in(normalized, text_content)
+            missing = [
+                item["page"] for item, snippet in zip(checked, normalized) if snippet not in found
+            ]
 
             results["missing_from_html"] = missing
             results["html_match_rate"] = (
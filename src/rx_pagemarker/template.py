@@ -1,8 +1,9 @@
 """Template generator for page references JSON files."""
 
 import json
+from itertools import chain
 from pathlib import Path
-from typing import List, Union
+from typing import Iterable, Union
 
 
 # Roman numerals for front matter (up to 20)
@@ -44,37 +45,48 @@ def generate_template(
         start_page: Starting page number (default: 1)
         use_roman: Use Roman numerals (i, ii, iii, etc.)
     """
-    references: List[dict] = []
+    end_page = start_page + num_pages  # exclusive
 
-    for i in range(num_pages):
-        page_num = start_page + i
-
-        # Format page number
-        if use_roman:
-            if page_num <= len(ROMAN_NUMERALS):
-                page_str = ROMAN_NUMERALS[page_num - 1]
-            else:
-                print(
-                    f"⚠ Warning: Roman numeral not defined for page {page_num}, using number"
-                )
-                page_str = str(page_num)
-        else:
-            page_str = str(page_num)
-
-        references.append(
-            {"page": page_str, "snippet": "PASTE_TEXT_FROM_END_OF_PAGE_HERE"}
+    # Format all page numbers in one pass
+    if use_roman:
+        # Pages outside the defined numerals fall back to plain numbers
+        roman_start = min(max(start_page, 1), end_page)
+        first_overflow = min(max(roman_start, len(ROMAN_NUMERALS) + 1), end_page)
+        if first_overflow < end_page:
+            print(
+                f"⚠ Warning: Roman numeral not defined for pages "
+                f"{first_overflow}-{end_page - 1}, using numbers"
+            )
+        pages: Iterable[str] = chain(
+            map(str, range(start_page, roman_start)),
+            ROMAN_NUMERALS[roman_start - 1 : first_overflow - 1],
+            map(str, range(first_overflow, end_page)),
         )
+    else:
+        pages = map(str, range(start_page, end_page))
 
-    # Write to file with nice formatting
+    # Stream entries to the file, matching json.dump(..., indent=2) layout
     output_path = Path(output_file)
+    first_page = last_page = ""
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(references, f, indent=2, ensure_ascii=False)
+        f.write("[")
+        for i, page_str in enumerate(pages):
+            entry = json.dumps(
+                {"page": page_str, "snippet": "PASTE_TEXT_FROM_END_OF_PAGE_HERE"},
+                indent=2,
+                ensure_ascii=False,
+            )
+            f.write(("," if i else "") + "\n  " + entry.replace("\n", "\n  "))
+            if i == 0:
+                first_page = page_str
+            last_page = page_str
+        f.write("\n]" if first_page else "]")
 
     print("=" * 60)
     print("PAGE REFERENCES TEMPLATE GENERATOR")
     print("=" * 60)
     print(f"✓ Generated template with {num_pages} page entries")
-    print(f"✓ Page range: {references[0]['page']} to {references[-1]['page']}")
+    print(f"✓ Page range: {first_page} to {last_page}")
     print(f"✓ Saved to: {output_path}")
     print("\n" + "=" * 60)
     print("NEXT STEPS")
@@ -5,6 +5,7 @@ where spaces are missing, using language-specific dictionaries and algorithms.
 """
 
 import warnings
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 import unicodedata
 import importlib.resources
@@ -191,9 +192,17 @@ class WordSegmenter:
         return final_words, confidence
 
 
+@lru_cache(maxsize=None)
+def _get_segmenter(language: str) -> WordSegmenter:
+    """Return the shared segmenter for a language, loading its dictionary once."""
+    return WordSegmenter(language=language)
+
+
 def segment_snippet(text: str, language: str = "el", max_words: int = 15) -> Tuple[str, float]:
     """Segment a text snippet with missing word boundaries.
 
+    The language dictionary is loaded on the first call and reused after.
+
     Args:
         text: Text with missing spaces
         language: Language code
@@ -202,5 +211,4 @@ def segment_snippet(text: str, language: str = "el", max_words: int = 15) -> Tup
     Returns:
         Tuple of (segmented_text, confidence_score)
     """
-    segmenter = WordSegmenter(language=language)
-    return segmenter.segment_text(text, max_words=max_words)
+    return _get_segmenter(language).segment_text(text, max_words=max_words)
@@ -1,6 +1,8 @@
 """Tests for CLI commands."""
 
 import json
+import subprocess
+import sys
 
 import pytest
 from click.testing import CliRunner
@@ -112,6 +114,25 @@ def test_mark_command(runner, tmp_path):
     assert "✓" in result.output
 
 
+def test_mark_command_lxml_parser(runner, tmp_path):
+    """Test mark command with the lxml parser."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(
+        "<!DOCTYPE html><html><body><p>Test <i>paragraph</i> here.</p></body></html>"
+    )
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([{"page": "1", "snippet": "paragraph here."}]))
+
+    output_file = tmp_path / "output.html"
+    result = runner.invoke(
+        cli,
+        ["mark", str(html_file), str(json_file), str(output_file), "--parser", "lxml"],
+    )
+
+    assert result.exit_code == 0
+    assert 'id="page1"' in output_file.read_text()
+
+
 def test_mark_command_missing_file(runner, tmp_path):
     """Test mark command with missing input file."""
     json_file = tmp_path / "refs.json"
@@ -122,3 +143,43 @@ def test_mark_command_missing_file(runner, tmp_path):
     )
 
     assert result.exit_code != 0
+
+
+def test_cli_import_does_not_load_pdf_backends():
+    """Test that importing the CLI leaves PDF extraction modules unloaded."""
+    code = (
+        "import sys, rx_pagemarker.cli; "
+        "print('rx_pagemarker.pdf_extractor' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_validate_command(runner, tmp_path):
+    """Test validate command execution."""
+    json_file = tmp_path / "snippets.json"
+    json_file.write_text(json.dumps([
+        {"page": 1, "snippet": "first page text"},
+        {"page": 2, "snippet": "PASTE_TEXT_FROM_END_OF_PAGE_HERE"},
+    ]))
+
+    result = runner.invoke(cli, ["validate", str(json_file)])
+
+    assert result.exit_code == 0
+    assert "Needs manual entry:  1" in result.output
+
+
+def test_extract_command_reports_invalid_parameter(runner, tmp_path):
+    """Test that extraction errors are reported with their category and exit 1."""
+    pdf_file = tmp_path / "book.pdf"
+    pdf_file.write_bytes(b"fake pdf")
+
+    result = runner.invoke(
+        cli, ["extract", str(pdf_file), str(tmp_path / "out.json"), "--raw-pdf", "-w", "0"]
+    )
+
+    assert result.exit_code == 1
+    assert "✗ Invalid parameter: snippet_words must be >= 1" in result.output
@@ -0,0 +1,226 @@
+"""Tests for HTML-based snippet matching."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from rx_pagemarker.html_matcher import HTMLMatcher, HTMLNotFoundError
+
+
+@pytest.fixture
+def html_file(tmp_path):
+    """Create an HTML file with a few paragraphs of text."""
+    path = tmp_path / "book.html"
+    path.write_text(
+        "<html><body>"
+        "<p>It was a bright cold day in April, and the clocks were striking thirteen.</p>"
+        "<p>The hallway smelt of boiled cabbage and old rag mats.</p>"
+        "<p>At one end of it a coloured poster, too large for indoor display, "
+        "had been tacked to the wall.</p>"
+        "</body></html>",
+        encoding="utf-8",
+    )
+    return path
+
+
+class TestHTMLMatcherInit:
+    """Test HTMLMatcher initialization."""
+
+    def test_init_with_missing_file(self, tmp_path):
+        """Test that a missing HTML file raises HTMLNotFoundError."""
+        with pytest.raises(HTMLNotFoundError):
+            HTMLMatcher(tmp_path / "missing.html")
+
+    def test_prefix_lengths_match_normalized_words(self, html_file):
+        """Test that prefix lengths track the normalized word lengths."""
+        matcher = HTMLMatcher(html_file)
+
+        assert len(matcher._cum_lens) == len(matcher._norm_words) + 1
+        for i, word in enumerate(matcher._norm_words):
+            assert matcher._cum_lens[i + 1] - matcher._cum_lens[i] == len(word)
+
+    def test_load_html_decodes_entities_and_skips_scripts(self, tmp_path):
+        """Test that extracted text has entities decoded and no script text."""
+        path = tmp_path / "book.html"
+        path.write_text(
+            '<?xml version="1.0" encoding="utf-8"?>'
+            "<html><head><style>p { margin: 0; }</style></head><body>"
+            '<p title="a > b">Fish &amp; chips &#8212; caf\u00e9</p>'
+            "<script>var x = 1;</script>"
+            "</body></html>",
+            encoding="utf-8",
+        )
+
+        matcher = HTMLMatcher(path)
+
+        assert matcher.html_text == "Fish & chips \u2014 caf\u00e9"
+
+    def test_load_html_joins_text_split_across_chunks(self, html_file):
+        """Test that words are not broken where file chunks or entities split text."""
+        expected = HTMLMatcher(html_file).html_text
+
+        with patch("rx_pagemarker.html_matcher._READ_CHUNK_SIZE", 7):
+            matcher = HTMLMatcher(html_file)
+
+        assert matcher.html_text == expected
+        assert "cabbage" in matcher._html_words
+
+    def test_corpus_cache_round_trip(self, html_file, tmp_path):
+        """Test that a cached corpus is reused and matches a fresh load."""
+        cache_dir = tmp_path / "cache"
+        fresh = HTMLMatcher(html_file, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        with patch.object(HTMLMatcher, "_load_html") as load_html:
+            cached = HTMLMatcher(html_file, cache_dir=cache_dir)
+
+        load_html.assert_not_called()
+        assert cached.html_text == fresh.html_text
+        assert cached._norm_words == fresh._norm_words
+        assert cached._cum_lens == fresh._cum_lens
+
+    def test_corpus_cache_miss_hashes_file_once(self, html_file, tmp_path):
+        """Test that a cache miss hashes the HTML once for both read and write."""
+        cache_dir = tmp_path / "cache"
+
+        with patch.object(
+            HTMLMatcher,
+            "_corpus_cache_path",
+            autospec=True,
+            side_effect=lambda self, d: d / "corpus.json",
+        ) as cache_path:
+            HTMLMatcher(html_file, cache_dir=cache_dir)
+
+        assert cache_path.call_count == 1
+        assert (cache_dir / "corpus.json").exists()
+
+    def test_corrupt_corpus_cache_is_rebuilt(self, html_file, tmp_path):
+        """Test that unparseable or mistyped cache files are ignored and rewritten."""
+        cache_dir = tmp_path / "cache"
+        fresh = HTMLMatcher(html_file, cache_dir=cache_dir)
+        cache_file = next(cache_dir.glob("*.json"))
+        for payload in ("{not json", '{"html_text": 5, "norm_words": []}'):
+            cache_file.write_text(payload, encoding="utf-8")
+
+            rebuilt = HTMLMatcher(html_file, cache_dir=cache_dir)
+
+            assert rebuilt.html_text == fresh.html_text
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            assert cached["html_text"] == fresh.html_text
+
+
+class TestCleanPdfSnippet:
+    """Test removal of PDF page furniture from snippets."""
+
+    def test_removes_layout_marker_and_timestamp(self, html_file):
+        """Test that layout markers with timestamps and page numbers are removed."""
+        matcher = HTMLMatcher(html_file)
+
+        cleaned = matcher.clean_pdf_snippet(
+            "end of the text 01_Layout 1 3/4/24 10:30 AM Page 7  more"
+        )
+
+        assert cleaned == "end of the text more"
+
+    def test_removes_page_numbers_case_insensitively(self, html_file):
+        """Test that page numbers are removed regardless of case."""
+        matcher = HTMLMatcher(html_file)
+
+        assert matcher.clean_pdf_snippet("PAGE 12 the hallway") == "the hallway"
+
+
+class TestFindBestSubstringMatch:
+    """Test window search over the HTML words."""
+
+    def test_restores_spaces_for_exact_match(self, html_file):
+        """Test that a PDF snippet without spaces gets HTML word boundaries."""
+        matcher = HTMLMatcher(html_file)
+
+        result = matcher.find_match("theclockswerestrikingthirteen.")
+
+        assert result["matched_text"] == "the clocks were striking thirteen."
+        assert result["confidence"] == 1.0
+
+    def test_uppercase_greek_matches_exactly(self, tmp_path):
+        """Test that final sigma doesn't depend on where the snippet's words end."""
+        path = tmp_path / "greek.html"
+        path.write_text(
+            "<p>Η ΖΩΗ ΤΗΣ ΠΟΛΗΣ ΚΑΙ ΤΟΥΣ ΑΝΘΡΩΠΟΥΣ ΤΗΣ.</p>", encoding="utf-8"
+        )
+        matcher = HTMLMatcher(path)
+
+        result = matcher.find_match("ΤΗΣΠΟΛΗΣΚΑΙΤΟΥΣΑΝΘΡΩΠΟΥΣ")
+
+        assert result["matched_text"] == "ΤΗΣ ΠΟΛΗΣ ΚΑΙ ΤΟΥΣ ΑΝΘΡΩΠΟΥΣ"
+        assert result["confidence"] == 1.0
+
+    def test_exact_match_skips_fuzzy_scan(self, html_file):
+        """Test that a verbatim word-aligned match returns without fuzzy scoring."""
+        matcher = HTMLMatcher(html_file)
+
+        with patch("rx_pagemarker.html_matcher.process.extractOne") as extract_one:
+            text, score = matcher._find_best_substring_match("tackedtothewall.")
+
+        extract_one.assert_not_called()
+        assert text == "tacked to the wall."
+        assert score == 100.0
+
+    def test_exact_match_ignores_partial_words(self, html_file):
+        """Test that an occurrence starting mid-word falls back to fuzzy search."""
+        matcher = HTMLMatcher(html_file)
+
+        assert matcher._find_exact_word_match("allwaysmelt") is None
+        assert matcher._find_exact_word_match("hallwaysmelt") == "hallway smelt"
+
+    def test_fuzzy_match_with_typo(self, html_file):
+        """Test that a snippet with a typo still finds the right words."""
+        matcher = HTMLMatcher(html_file)
+
+        text, score = matcher._find_best_substring_match("boiledcabbageandoldragmuts.")
+
+        assert text == "boiled cabbage and old rag mats."
+        assert 80 < score < 100
+
+    def test_low_confidence_falls_back_to_cleaned_snippet(self, html_file):
+        """Test that unrelated text falls back to the cleaned PDF snippet."""
+        matcher = HTMLMatcher(html_file)
+
+        result = matcher.find_match("zzqx wvvk jjjy", min_confidence=0.9)
+
+        assert result["matched_text"] == "zzqx wvvk jjjy"
+        assert result["confidence"] < 0.9
+
+    def test_repeated_snippet_uses_cached_search(self, html_file):
+        """Test that snippets normalizing to the same text are searched once."""
+        matcher = HTMLMatcher(html_file)
+
+        first = matcher.find_match("The hallway smelt Page 12")
+        second = matcher.find_match("thehallway smelt")
+
+        assert first["matched_text"] == second["matched_text"] == "The hallway smelt"
+        assert matcher._match_cache.cache_info().hits == 1
+        assert matcher._match_cache.cache_info().misses == 1
+
+
+class TestFindMatchBatch:
+    """Test batch matching across worker processes."""
+
+    def test_parallel_batch_matches_serial_results(self, html_file):
+        """Test that worker processes return the same results in order."""
+        matcher = HTMLMatcher(html_file)
+        snippets = [
+            "theclockswerestrikingthirteen.",
+            "boiledcabbageandoldragmats.",
+            "tackedtothewall.",
+        ]
+
+        serial = matcher.find_match_batch(snippets)
+        parallel = matcher.find_match_batch(snippets, workers=2)
+
+        assert parallel == serial
+        assert [r["matched_text"] for r in serial] == [
+            "the clocks were striking thirteen.",
+            "boiled cabbage and old rag mats.",
+            "tacked to the wall.",
+        ]
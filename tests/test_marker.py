@@ -1,8 +1,11 @@
 """Tests for page marker insertion."""
 
 import json
+import sys
 import tempfile
+import unicodedata
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from bs4 import BeautifulSoup
@@ -88,6 +91,20 @@ def test_load_page_references(simple_html, page_references, tmp_path):
     assert inserter.page_references[0]["page"] == "1"
 
 
+def test_load_page_references_without_orjson(simple_html, page_references, tmp_path):
+    """Test JSON loading falls back to the standard library."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(simple_html)
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps(page_references))
+
+    inserter = PageMarkerInserter(html_file, json_file)
+    with patch("rx_pagemarker.marker.HAS_ORJSON", False):
+        inserter.load_page_references()
+
+    assert inserter.page_references == page_references
+
+
 def test_create_page_marker(simple_html, tmp_path):
     """Test page marker creation."""
     html_file = tmp_path / "test.html"
@@ -176,6 +193,26 @@ def test_snippet_not_found(simple_html, tmp_path):
     assert inserter.stats["not_found"] == 1
 
 
+def test_snippet_before_previous_marker_reported(simple_html, tmp_path):
+    """Test that out-of-order snippets are reported as existing earlier."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(simple_html)
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([
+        {"page": "1", "snippet": "with some text."},
+        {"page": "2", "snippet": "simple paragraph."},
+    ]))
+    output_file = tmp_path / "output.html"
+
+    inserter = PageMarkerInserter(html_file, json_file, output_file)
+    inserter.run()
+
+    assert inserter.stats["found"] == 1
+    assert inserter.stats["not_found"] == 1
+    assert inserter.failed_pages[0]["page"] == "2"
+    assert inserter.failed_pages[0]["earlier_container"] == 0
+
+
 def test_roman_numerals(simple_html, tmp_path):
     """Test Roman numeral page numbers."""
     html_file = tmp_path / "test.html"
@@ -222,6 +259,284 @@ def test_greek_text(tmp_path):
     assert output_file.exists()
 
 
+def test_snippet_matches_across_unicode_normalization_forms(tmp_path):
+    """Test that a decomposed PDF snippet still matches precomposed HTML text."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(
+        "<html><body><p>Το κείμενο είναι εδώ.</p></body></html>", encoding="utf-8"
+    )
+    json_file = tmp_path / "refs.json"
+    json_file.write_text("[]")
+    output_file = tmp_path / "output.html"
+
+    inserter = PageMarkerInserter(html_file, json_file, output_file)
+    inserter.load_html()
+
+    snippet = unicodedata.normalize("NFD", "κείμενο είναι")
+    assert inserter.insert_page_marker("1", snippet)
+    assert inserter.stats["unicode_normalized"] == 1
+
+    inserter.save()
+    assert "κείμενο είναι <span" in output_file.read_text(encoding="utf-8")
+
+
+def test_snippet_matches_with_different_whitespace(tmp_path):
+    """Test that whitespace runs in the snippet may differ from the HTML text."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(
+        "<html><body><p>First part ends\n   here. Second <i>part</i>  follows.</p></body></html>"
+    )
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([
+        {"page": "1", "snippet": "part ends here."},
+        {"page": "2", "snippet": "Second  part|follows."},
+    ]))
+    output_file = tmp_path / "output.html"
+
+    inserter = PageMarkerInserter(html_file, json_file, output_file)
+    inserter.run()
+
+    assert inserter.stats["found"] == 2
+    assert inserter.stats["whitespace_normalized"] == 2
+    output = output_file.read_text()
+    assert '\n   here. <span aria-label="Page 1"' in output
+    assert 'part <span aria-label="Page 2"' in output
+
+
+def test_multiple_markers_in_same_paragraph(tmp_path):
+    """Test that later markers in a paragraph see earlier insertions."""
+    html = """
+    <html>
+    <body>
+        <p>First <i>part</i> ends here. Second part ends here. Third part ends.</p>
+    </body>
+    </html>
+    """
+    html_file = tmp_path / "test.html"
+    html_file.write_text(html)
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([
+        {"page": "1", "snippet": "part ends here."},
+        {"page": "2", "snippet": "part ends here."},
+        {"page": "3", "snippet": "part ends."},
+    ]))
+    output_file = tmp_path / "output.html"
+
+    inserter = PageMarkerInserter(html_file, json_file, output_file)
+    inserter.run()
+
+    assert inserter.stats["found"] == 3
+
+    with open(output_file) as f:
+        soup = BeautifulSoup(f.read(), "lxml")
+
+    paragraph = soup.find("p")
+    markers = paragraph.find_all("span", class_="page-number")
+    assert [m.string for m in markers] == ["1", "2", "3"]
+    assert "ends here. 1 Second" in paragraph.get_text()
+    assert "ends here. 2 Third" in paragraph.get_text()
+
+
+def test_page_break_marker_in_snippet(tmp_path):
+    """Test that a "|" in the snippet places the marker at the break point."""
+    assert PageMarkerInserter._parse_snippet("ends here.| Second part") == (
+        "ends here. Second part",
+        len("ends here."),
+    )
+    assert PageMarkerInserter._parse_snippet("no break") == ("no break", 8)
+
+    html_file = tmp_path / "test.html"
+    html_file.write_text("<html><body><p>First part ends here. Second part follows.</p></body></html>")
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([{"page": "1", "snippet": "ends here.|Second part"}]))
+    output_file = tmp_path / "output.html"
+
+    inserter = PageMarkerInserter(html_file, json_file, output_file)
+    inserter.run()
+
+    assert "ends here. <span" in output_file.read_text()
+
+
+def test_comment_does_not_shift_marker_position(tmp_path):
+    """Test that HTML comments inside a container don't offset the marker."""
+    html = "<html><body><p>Start <!-- editor note --> middle words end.</p></body></html>"
+    html_file = tmp_path / "test.html"
+    html_file.write_text(html)
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([{"page": "1", "snippet": "middle words"}]))
+    output_file = tmp_path / "output.html"
+
+    inserter = PageMarkerInserter(html_file, json_file, output_file)
+    inserter.run()
+
+    output = output_file.read_text()
+    assert "middle words <span" in output
+    assert "<!-- editor note -->" in output
+
+
+def test_container_index_patched_after_insertion(formatted_html, tmp_path):
+    """Test that the modified container's text index is patched in place."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(formatted_html)
+    json_file = tmp_path / "refs.json"
+    json_file.write_text("[]")
+
+    inserter = PageMarkerInserter(html_file, json_file)
+    inserter.load_html()
+
+    containers = inserter._get_containers()
+    entries = [inserter._get_container_entry(i) for i in range(len(containers))]
+    assert inserter.insert_page_marker("1", entries[0][0].split()[1])
+    assert inserter.insert_page_marker("2", entries[0][0].split()[-1])
+
+    # Patched entry matches a fresh walk; other containers keep their entries
+    patched = inserter._container_index[0]
+    fresh = inserter._index_container(containers[0])
+    assert patched[0] == fresh[0]
+    assert patched[1] == fresh[1]
+    assert [n is m for n, m in zip(patched[2], fresh[2])] == [True] * len(fresh[2])
+    assert "1" in patched[0].split()
+    for i in range(1, len(containers)):
+        assert inserter._container_index[i] is entries[i]
+
+
+def test_out_of_order_markers_removed_on_save(tmp_path):
+    """Test that inserted markers breaking page order are removed, others kept."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(
+        "<html><body>"
+        '<p>Existing <span class="page-number">9</span> marker.</p>'
+        "<p>First words here.</p><p>Second words here.</p><p>Third words here.</p>"
+        "</body></html>"
+    )
+    json_file = tmp_path / "refs.json"
+    json_file.write_text("[]")
+    output_file = tmp_path / "output.html"
+
+    inserter = PageMarkerInserter(html_file, json_file, output_file)
+    inserter.load_html()
+    assert inserter.insert_page_marker("5", "First words")
+    assert inserter.insert_page_marker("3", "Second words")
+    assert inserter.insert_page_marker("ix", "Third words")
+    inserter.save()
+
+    soup = BeautifulSoup(output_file.read_text(), "lxml")
+    pages = [m.string for m in soup.find_all("span", class_="page-number")]
+    assert pages == ["9", "5", "ix"]
+    assert inserter.stats["out_of_order"] == 1
+
+
+def test_placeholder_snippet_skipped(simple_html, tmp_path):
+    """Test that unfilled template placeholders are reported without searching."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(simple_html)
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([
+        {"page": "1", "snippet": "PASTE_TEXT_FROM_END_OF_PAGE_HERE"},
+        {"page": "2", "snippet": "simple paragraph."},
+    ]))
+    output_file = tmp_path / "output.html"
+
+    inserter = PageMarkerInserter(html_file, json_file, output_file)
+    with patch.object(
+        inserter, "find_snippet_location", wraps=inserter.find_snippet_location
+    ) as find:
+        inserter.run()
+
+    assert find.call_count == 1
+    assert inserter.stats["found"] == 1
+    assert inserter.stats["not_found"] == 1
+    assert inserter.failed_pages[0]["page"] == "1"
+    assert inserter.failed_pages[0]["placeholder"] is True
+
+
+def test_process_buffers_per_page_output(simple_html, tmp_path, capsys):
+    """Test that per-page lines are written together after all insertions."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(simple_html)
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([
+        {"page": "1", "snippet": "simple paragraph."},
+        {"page": "2", "snippet": "nonexistent text"},
+    ]))
+
+    inserter = PageMarkerInserter(html_file, json_file)
+    inserter.load_html()
+    inserter.load_page_references()
+    capsys.readouterr()
+
+    original_insert = inserter.insert_page_marker
+
+    def insert_and_check(*args, **kwargs):
+        result = original_insert(*args, **kwargs)
+        assert "Page" not in capsys.readouterr().out
+        return result
+
+    with patch.object(inserter, "insert_page_marker", side_effect=insert_and_check):
+        inserter.process()
+
+    out = capsys.readouterr().out
+    assert "✓ Page 1: Marker inserted" in out
+    assert "✗ Page 2: Snippet not found" in out
+    assert out.index("Page 1") < out.index("Page 2")
+    assert inserter._log is None
+
+
+def test_process_flushes_buffer_in_batches_on_tty(simple_html, tmp_path, capsys):
+    """Test that buffered lines are flushed every TTY_FLUSH_LINES on a terminal."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(simple_html)
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([
+        {"page": "1", "snippet": "simple paragraph."},
+        {"page": "2", "snippet": "nonexistent text"},
+    ]))
+
+    inserter = PageMarkerInserter(html_file, json_file)
+    inserter.load_html()
+    inserter.load_page_references()
+    capsys.readouterr()
+
+    original_insert = inserter.insert_page_marker
+    outputs = []
+
+    def insert_and_capture(*args, **kwargs):
+        result = original_insert(*args, **kwargs)
+        outputs.append(capsys.readouterr().out)
+        return result
+
+    with patch("rx_pagemarker.marker.TTY_FLUSH_LINES", 1), \
+            patch.object(sys.stdout, "isatty", return_value=True), \
+            patch.object(inserter, "insert_page_marker", side_effect=insert_and_capture):
+        inserter.process()
+
+    assert "✓ Page 1: Marker inserted" in outputs[0]
+    assert "✗ Page 2: Snippet not found" in outputs[1]
+
+
+def test_verbose_prints_per_page_output_immediately(simple_html, tmp_path, capsys):
+    """Test that verbose mode prints each page line as it is inserted."""
+    html_file = tmp_path / "test.html"
+    html_file.write_text(simple_html)
+    json_file = tmp_path / "refs.json"
+    json_file.write_text(json.dumps([{"page": "1", "snippet": "simple paragraph."}]))
+
+    inserter = PageMarkerInserter(html_file, json_file, verbose=True)
+    inserter.load_html()
+    inserter.load_page_references()
+    capsys.readouterr()
+
+    original_insert = inserter.insert_page_marker
+
+    def insert_and_check(*args, **kwargs):
+        result = original_insert(*args, **kwargs)
+        assert "✓ Page 1: Marker inserted" in capsys.readouterr().out
+        return result
+
+    with patch.object(inserter, "insert_page_marker", side_effect=insert_and_check):
+        inserter.process()
+
+
 class TestContextDisambiguation:
     """Test context-based disambiguation for duplicate snippets."""
 
@@ -241,6 +556,13 @@ class TestContextDisambiguation:
         # Already lowercase, no accent
         assert inserter._normalize_word("word") == "word"
 
+    def test_normalize_word_ascii_and_latin_accents(self):
+        """Test that ASCII words are lowercased and Latin accents stripped."""
+        assert PageMarkerInserter._normalize_word("Word") == "word"
+        assert PageMarkerInserter._normalize_word("Café") == "cafe"
+        assert PageMarkerInserter._normalize_word("Café") == "cafe"
+        assert PageMarkerInserter._normalize_word.cache_info().hits >= 1
+
     def test_jaccard_similarity_identical(self, tmp_path):
         """Test Jaccard similarity for identical word lists."""
         html_file = tmp_path / "test.html"
@@ -406,6 +728,36 @@ class TestContextDisambiguation:
         assert second_p_marker is not None, "Marker should be in second paragraph"
         assert second_p_marker.string == "1"
 
+    def test_perfect_context_match_stops_scoring(self, tmp_path):
+        """Test that later candidates are not scored after a perfect context match."""
+        html_file = tmp_path / "test.html"
+        html_file.write_text(
+            "<html><body>"
+            "<p>one two three four duplicate text five six seven eight</p>"
+            "<p>nine ten duplicate text eleven twelve</p>"
+            "<p>more words duplicate text other words</p>"
+            "</body></html>"
+        )
+        json_file = tmp_path / "refs.json"
+        json_file.write_text("[]")
+
+        inserter = PageMarkerInserter(html_file, json_file)
+        inserter.load_html()
+
+        with patch.object(
+            inserter, "_score_context_match", wraps=inserter._score_context_match
+        ) as score:
+            result = inserter.insert_page_marker(
+                page_number="1",
+                snippet="duplicate text",
+                context_before="one two three four",
+                context_after="five six seven eight",
+            )
+
+        assert result is True
+        assert score.call_count == 1
+        assert inserter._last_insertion_container_idx == 0
+
     def test_find_all_snippet_locations(self, tmp_path):
         """Test finding all occurrences of a snippet."""
         duplicate_html = """
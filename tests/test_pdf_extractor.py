@@ -1,6 +1,8 @@
 """Tests for PDF extraction functionality."""
 
 import json
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
@@ -89,6 +91,16 @@ class TestPDFExtractorInit:
         extractor = PDFExtractor("test.pdf", backend="auto")
         assert extractor.backend == "pdfplumber"
 
+    @patch("rx_pagemarker.pdf_extractor.HAS_PYMUPDF", True)
+    @patch("rx_pagemarker.pdf_extractor.HAS_PDFPLUMBER", True)
+    @patch("rx_pagemarker.pdf_extractor.pdfplumber", Mock())
+    @patch("rx_pagemarker.pdf_extractor.fitz", None)
+    def test_backend_auto_skips_broken_pymupdf(self):
+        """Test that a PyMuPDF install that fails to import falls back to pdfplumber."""
+        with patch.dict(sys.modules, {"fitz": None}):
+            extractor = PDFExtractor("test.pdf", backend="auto")
+        assert extractor.backend == "pdfplumber"
+
 
 class TestPDFExtractorExtract:
     """Test PDF extraction methods."""
@@ -153,6 +165,26 @@ class TestPDFExtractorExtract:
         assert snippets[0]["snippet"] == "PASTE_TEXT_FROM_END_OF_PAGE_HERE"
         assert "Insufficient text" in snippets[0]["note"]
 
+    def test_extract_with_pymupdf_page_workers_matches_serial(self, tmp_path):
+        """Test that parallel page text extraction returns the serial results in order."""
+        fitz = pytest.importorskip("fitz")
+        pdf_path = tmp_path / "test.pdf"
+        doc = fitz.open()
+        for i in range(1, 6):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Sample text from page number {i} ends here.")
+        doc.save(str(pdf_path))
+        doc.close()
+
+        serial = PDFExtractor(pdf_path, backend="pymupdf", skip_footnotes=False).extract()
+        parallel = PDFExtractor(
+            pdf_path, backend="pymupdf", skip_footnotes=False, page_workers=2
+        ).extract()
+
+        assert parallel == serial
+        assert [s["page"] for s in parallel] == [1, 2, 3, 4, 5]
+        assert "page number 5 ends here." in parallel[4]["snippet"]
+
     @patch("rx_pagemarker.pdf_extractor.HAS_PDFPLUMBER", True)
     @patch("rx_pagemarker.pdf_extractor.pdfplumber")
     def test_extract_with_pdfplumber_success(self, mock_pdfplumber, tmp_path):
@@ -177,6 +209,134 @@ class TestPDFExtractorExtract:
         assert snippets[0]["page"] == 1
         assert "sample text from the page" in snippets[0]["snippet"]
 
+    @patch("rx_pagemarker.pdf_extractor.HAS_PDFPLUMBER", True)
+    @patch("rx_pagemarker.pdf_extractor.pdfplumber")
+    def test_extract_with_pdfplumber_batches_html_matching(self, mock_pdfplumber, tmp_path):
+        """Test that fuzzy HTML matching runs once over all pages."""
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"fake pdf")
+
+        mock_pages = [MagicMock(), MagicMock()]
+        mock_pages[0].extract_text.return_value = "This is sample text from page one."
+        mock_pages[1].extract_text.return_value = "This is sample text from page two."
+
+        mock_pdf = MagicMock()
+        mock_pdf.pages = mock_pages
+        mock_pdf.__enter__.return_value = mock_pdf
+        mock_pdf.__exit__.return_value = None
+
+        mock_pdfplumber.open.return_value = mock_pdf
+
+        extractor = PDFExtractor(pdf_path, backend="pdfplumber", match_workers=4)
+        extractor.html_matcher = MagicMock()
+        extractor.html_matcher.find_match_batch.return_value = [
+            {"matched_text": "text from page one.", "confidence": 0.912},
+            {"matched_text": "text from page two. ", "confidence": 0.876},
+        ]
+        snippets = extractor.extract()
+
+        extractor.html_matcher.find_match_batch.assert_called_once()
+        args, kwargs = extractor.html_matcher.find_match_batch.call_args
+        assert len(args[0]) == 2
+        assert kwargs["workers"] == 4
+        assert snippets == [
+            {"page": 1, "snippet": "text from page one.", "confidence": 0.91, "method": "html_match"},
+            {"page": 2, "snippet": "text from page two.", "confidence": 0.88, "method": "html_match"},
+        ]
+
+    @patch("rx_pagemarker.pdf_extractor.HAS_PDFPLUMBER", True)
+    @patch("rx_pagemarker.pdf_extractor.pdfplumber")
+    def test_extract_with_pdfplumber_html_matching_failure(self, mock_pdfplumber, tmp_path):
+        """Test that a failing batch match is reported as PDFExtractionError."""
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"fake pdf")
+
+        mock_page = MagicMock()
+        mock_page.extract_text.return_value = "This is sample text from page one."
+
+        mock_pdf = MagicMock()
+        mock_pdf.pages = [mock_page]
+        mock_pdf.__enter__.return_value = mock_pdf
+        mock_pdf.__exit__.return_value = None
+
+        mock_pdfplumber.open.return_value = mock_pdf
+
+        extractor = PDFExtractor(pdf_path, backend="pdfplumber", match_workers=2)
+        extractor.html_matcher = MagicMock()
+        extractor.html_matcher.find_match_batch.side_effect = RuntimeError("pool broke")
+
+        with pytest.raises(PDFExtractionError, match="Error matching snippets against HTML"):
+            extractor.extract()
+
+    @patch("rx_pagemarker.pdf_extractor.pdfplumber")
+    def test_extract_page_range_skips_other_pages(self, mock_pdfplumber, tmp_path):
+        """Test that pages outside start_page..end_page are never read."""
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"fake pdf")
+
+        mock_pages = [MagicMock() for _ in range(3)]
+        for i, mock_page in enumerate(mock_pages, 1):
+            mock_page.extract_text.return_value = f"This is sample text from page {i}."
+
+        mock_pdf = MagicMock()
+        mock_pdf.pages = mock_pages
+        mock_pdf.__enter__.return_value = mock_pdf
+        mock_pdf.__exit__.return_value = None
+
+        mock_pdfplumber.open.return_value = mock_pdf
+
+        extractor = PDFExtractor(pdf_path, backend="pdfplumber")
+        snippets = extractor.extract(start_page=2, end_page=2)
+
+        assert [s["page"] for s in snippets] == [2]
+        assert extractor.stats["total_pages"] == 1
+        mock_pages[0].extract_text.assert_not_called()
+        mock_pages[2].extract_text.assert_not_called()
+
+    @patch("rx_pagemarker.pdf_extractor.pdfplumber")
+    def test_extract_progress_goes_to_stderr(self, mock_pdfplumber, tmp_path, capsys):
+        """Test that page progress is written to stderr and silenced by verbose=False."""
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"fake pdf")
+
+        mock_pages = [MagicMock() for _ in range(50)]
+        for mock_page in mock_pages:
+            mock_page.extract_text.return_value = "This is sample text from a page."
+
+        mock_pdf = MagicMock()
+        mock_pdf.pages = mock_pages
+        mock_pdf.__enter__.return_value = mock_pdf
+        mock_pdf.__exit__.return_value = None
+
+        mock_pdfplumber.open.return_value = mock_pdf
+
+        PDFExtractor(pdf_path, backend="pdfplumber").extract()
+        captured = capsys.readouterr()
+        assert "Processing page 50/50" in captured.err
+        assert "Processing page" not in captured.out
+
+        PDFExtractor(pdf_path, backend="pdfplumber", verbose=False).extract()
+        assert "Processing page" not in capsys.readouterr().err
+
+    def test_bottom_visual_reads_bottom_band_only(self):
+        """Test that bottom_visual skips the full page when the bottom band has enough words."""
+        page = MagicMock()
+        page.bbox = (0, 0, 600, 800)
+        page.crop.return_value.extract_words.return_value = [
+            {"text": word, "top": 700.0 + 10 * i, "x0": 50.0}
+            for i, word in enumerate("one two three four five six".split())
+        ]
+
+        extractor = PDFExtractor(
+            "test.pdf", backend="pdfplumber", snippet_words=4, min_words=3,
+            strategy="bottom_visual",
+        )
+        result = extractor._extract_page_snippet_pdfplumber(page, 1)
+
+        assert result["snippet"] == "three four five six"
+        page.crop.assert_called_once_with((0, 600.0, 600, 800))
+        page.extract_words.assert_not_called()
+
 
 class TestPDFExtractorSaveToJson:
     """Test JSON saving functionality."""
@@ -209,6 +369,22 @@ class TestPDFExtractorSaveToJson:
             content = f.read()
         assert "Ελληνικό κείμενο" in content
 
+    def test_save_to_json_without_orjson_matches(self, tmp_path):
+        """Test that the stdlib fallback writes the same bytes as orjson."""
+        extractor = PDFExtractor("dummy.pdf")
+        snippets = [
+            {"page": 1, "snippet": "Ελληνικό κείμενο", "confidence": 0.91, "method": "html_match"},
+            {"page": 2, "snippet": "text here", "method": "pdf_text"},
+        ]
+        fast_path = tmp_path / "fast.json"
+        slow_path = tmp_path / "slow.json"
+
+        extractor.save_to_json(fast_path, snippets)
+        with patch("rx_pagemarker.pdf_extractor.HAS_ORJSON", False):
+            extractor.save_to_json(slow_path, snippets)
+
+        assert fast_path.read_bytes() == slow_path.read_bytes()
+
     def test_save_to_json_invalid_path(self):
         """Test that PDFExtractionError is raised for invalid path."""
         extractor = PDFExtractor("dummy.pdf")
@@ -296,6 +472,84 @@ class TestValidateSnippets:
         assert 2 in results["missing_from_html"]
         assert results["html_match_rate"] == 0.5
 
+    def test_validate_snippets_with_overlapping_snippets(self, tmp_path):
+        """Test that overlapping and repeated snippets are each found in the HTML."""
+        json_path = tmp_path / "snippets.json"
+        html_path = tmp_path / "book.html"
+        json_path.write_text(json.dumps([
+            {"page": 1, "snippet": "quick brown fox"},
+            {"page": 2, "snippet": "brown fox jumps"},
+            {"page": 3, "snippet": "fox"},
+            {"page": 4, "snippet": "fox"},
+            {"page": 5, "snippet": "lazy cat"},
+        ]))
+        html_path.write_text("<p>The quick brown <em>fox jumps</em> over the lazy dog.</p>")
+
+        results = validate_snippets(json_path, html_path)
+
+        assert results["missing_from_html"] == [5]
+
+    def test_validate_snippets_with_ahocorasick(self, tmp_path):
+        """Test the single-pass automaton branch, including a placeholder-only file."""
+
+        class FakeAutomaton:
+            """Stand-in for ahocorasick.Automaton that refuses empty searches."""
+
+            def __init__(self):
+                self.words = {}
+
+            def add_word(self, key, value):
+                self.words[key] = value
+
+            def make_automaton(self):
+                pass
+
+            def iter(self, text):
+                if not self.words:
+                    raise AttributeError("Not an Aho-Corasick automaton yet")
+                for key, value in self.words.items():
+                    start = text.find(key)
+                    while start != -1:
+                        yield start + len(key) - 1, value
+                        start = text.find(key, start + 1)
+
+        json_path = tmp_path / "snippets.json"
+        html_path = tmp_path / "book.html"
+        html_path.write_text("<p>The quick brown <em>fox jumps</em> over the lazy dog.</p>")
+        fake_module = Mock(Automaton=FakeAutomaton)
+
+        with patch("rx_pagemarker.pdf_extractor.HAS_AHOCORASICK", True), patch(
+            "rx_pagemarker.pdf_extractor.ahocorasick", fake_module, create=True
+        ):
+            json_path.write_text(json.dumps([
+                {"page": 1, "snippet": "brown fox jumps"},
+                {"page": 2, "snippet": "fox"},
+                {"page": 3, "snippet": "lazy cat"},
+            ]))
+            results = validate_snippets(json_path, html_path)
+            assert results["missing_from_html"] == [3]
+
+            json_path.write_text(json.dumps([
+                {"page": 1, "snippet": "PASTE_TEXT_FROM_END_OF_PAGE_HERE"},
+            ]))
+            results = validate_snippets(json_path, html_path)
+            assert results["missing_from_html"] == []
+            assert results["html_match_rate"] == 0.0
+
+    def test_validate_snippets_normalizes_entities_and_whitespace(self, tmp_path):
+        """Test that entities, line breaks and NBSPs in the HTML don't cause misses."""
+        json_path = tmp_path / "snippets.json"
+        html_path = tmp_path / "book.html"
+        json_path.write_text(json.dumps([
+            {"page": 1, "snippet": "fish & chips"},
+            {"page": 2, "snippet": "on the  table"},
+        ]))
+        html_path.write_text("<p>Fish and fish &amp; chips\nwere on the&nbsp;table.</p>")
+
+        results = validate_snippets(json_path, html_path)
+
+        assert results["missing_from_html"] == []
+
     def test_validate_snippets_invalid_json(self, tmp_path):
         """Test that PDFExtractionError is raised for invalid JSON."""
         json_path = tmp_path / "invalid.json"
@@ -309,6 +563,21 @@ class TestValidateSnippets:
         with pytest.raises(PDFExtractionError, match="Error loading JSON"):
             validate_snippets("/nonexistent/file.json")
 
+    def test_validate_snippets_does_not_load_pdf_backends(self, tmp_path):
+        """Test that validation runs without importing PyMuPDF or pdfplumber."""
+        json_path = tmp_path / "snippets.json"
+        json_path.write_text(json.dumps([{"page": 1, "snippet": "some text"}]))
+        code = (
+            "import sys; from rx_pagemarker.pdf_extractor import validate_snippets; "
+            f"validate_snippets({str(json_path)!r}); "
+            "print('fitz' in sys.modules, 'pdfplumber' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False False"
+
 
 class TestPrintValidationResults:
     """Test validation results printing."""
@@ -71,3 +71,14 @@ def test_generate_unicode_filename(tmp_path):
         data = json.load(f)
 
     assert len(data) == 3
+
+
+def test_generate_roman_overflow_uses_numbers(tmp_path):
+    """Test that pages beyond the Roman numeral table fall back to numbers."""
+    output_file = tmp_path / "template.json"
+    generate_template(4, output_file, start_page=19, use_roman=True)
+
+    with open(output_file) as f:
+        data = json.load(f)
+
+    assert [entry["page"] for entry in data] == ["xix", "xx", "21", "22"]